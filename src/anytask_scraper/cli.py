@@ -715,11 +715,11 @@ def _run_gradebook(args: argparse.Namespace, client: AnytaskClient) -> None:
         if args.include_columns:
             columns = args.include_columns
         elif args.exclude_columns:
-            all_cols = ["Group", "Student"]
-            for g in gradebook.groups:
-                for t in g.task_titles:
-                    if t not in all_cols:
-                        all_cols.append(t)
+            all_cols = list(
+                dict.fromkeys(
+                    ["Group", "Student", *(t for g in gradebook.groups for t in g.task_titles)]
+                )
+            )
             all_cols.append("Total")
             columns = [c for c in all_cols if c not in args.exclude_columns]
         path = save_gradebook_csv(gradebook, output_dir, columns=columns)
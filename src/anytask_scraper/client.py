@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -18,6 +19,8 @@ LOGIN_URL = f"{BASE_URL}/accounts/login/"
 
 _CSRF_RE = re.compile(r"name=['\"]csrfmiddlewaretoken['\"] value=['\"]([^'\"]+)['\"]")
 _COLAB_FILE_ID_RE = re.compile(r"(?:/drive/|/notebook/d/)([a-zA-Z0-9_-]+)")
+_DRIVE_ID_RE = re.compile(r"drive/([a-zA-Z0-9_-]+)")
+_CONFIRM_RE = re.compile(rb"confirm=([a-zA-Z0-9_-]+)")
 
 
 @dataclass
@@ -41,6 +44,8 @@ class AnytaskClient:
         self.password = password
         self._client = httpx.Client(follow_redirects=True, timeout=30.0)
         self._authenticated = False
+        self._login_lock = threading.Lock()
+        self._login_generation = 0
 
     def _has_credentials(self) -> bool:
         return bool(self.username and self.password)
@@ -82,22 +87,38 @@ class AnytaskClient:
             raise LoginError("Login failed: check username and password")
 
         self._authenticated = True
+        self._login_generation += 1
         logger.info("Login successful")
 
-    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        if not self._authenticated and self._has_credentials():
+    def ensure_authenticated(self) -> None:
+        """Log in if credentials are set and no session is active."""
+        if self._authenticated or not self._has_credentials():
+            return
+        with self._login_lock:
+            if not self._authenticated:
+                self.login()
+
+    def _reauthenticate(self, generation: int) -> None:
+        """Log in again after a login redirect unless another thread already has."""
+        with self._login_lock:
+            if self._login_generation != generation:
+                return
+            logger.info("Session expired, re-authenticating")
+            self._authenticated = False
+            if not self._has_credentials():
+                raise LoginError("Saved session expired and no credentials were provided")
             self.login()
 
+    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        self.ensure_authenticated()
+
+        generation = self._login_generation
         logger.debug("%s %s", method, url)
         resp = self._client.request(method, url, **kwargs)
         logger.debug("%s %s -> %d", method, url, resp.status_code)
 
         if self._is_login_response(resp):
-            logger.info("Session expired, re-authenticating")
-            self._authenticated = False
-            if not self._has_credentials():
-                raise LoginError("Saved session expired and no credentials were provided")
-            self.login()
+            self._reauthenticate(generation)
             resp = self._client.request(method, url, **kwargs)
 
         resp.raise_for_status()
@@ -106,12 +127,14 @@ class AnytaskClient:
     def load_session(self, session_path: Path | str) -> bool:
         """Load cookie session from file."""
         path = Path(session_path)
-        if not path.exists():
+        try:
+            data = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             logger.debug("Session file not found: %s", path)
             return False
 
         logger.info("Loading session from %s", path)
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = json.loads(data)
         cookies = raw.get("cookies", [])
         if not isinstance(cookies, list):
             return False
@@ -136,6 +159,7 @@ class AnytaskClient:
             self.username = saved_username
 
         self._authenticated = True
+        self._login_generation += 1
         logger.info("Session loaded with %d cookies", len(cookies))
         return True
 
@@ -160,7 +184,8 @@ class AnytaskClient:
             "username": self.username,
             "cookies": cookies,
         }
-        path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        path.write_text(data, encoding="utf-8")
 
     def fetch_course_page(self, course_id: int) -> str:
         """Return course page HTML."""
@@ -254,12 +279,10 @@ class AnytaskClient:
 
     def _download_to_file(self, url: str, dest: Path) -> httpx.Response:
         """Stream download to file, handling login redirects."""
+        generation = self._login_generation
         with self._client.stream("GET", url) as resp:
             if self._is_login_response(resp):
-                self._authenticated = False
-                if not self._has_credentials():
-                    raise LoginError("Saved session expired and no credentials were provided")
-                self.login()
+                self._reauthenticate(generation)
                 with self._client.stream("GET", url) as retried:
                     retried.raise_for_status()
                     with dest.open("wb") as f:
@@ -310,8 +333,7 @@ class AnytaskClient:
     def download_file(self, url: str, output_path: str) -> DownloadResult:
         """Download file to local path with content validation."""
         logger.debug("Downloading %s -> %s", url, output_path)
-        if not self._authenticated and self._has_credentials():
-            self.login()
+        self.ensure_authenticated()
 
         full_url = url if url.startswith("http") else f"{BASE_URL}{url}"
         output = Path(output_path)
@@ -341,7 +363,7 @@ class AnytaskClient:
 
     def download_colab_notebook(self, colab_url: str, output_path: str) -> DownloadResult:
         """Try downloading a Colab notebook as .ipynb."""
-        m = _COLAB_FILE_ID_RE.search(colab_url) or re.search(r"drive/([a-zA-Z0-9_-]+)", colab_url)
+        m = _COLAB_FILE_ID_RE.search(colab_url) or _DRIVE_ID_RE.search(colab_url)
         if m is None:
             return DownloadResult(success=False, path=output_path, reason="no_file_id_in_url")
 
@@ -369,7 +391,7 @@ class AnytaskClient:
                     if content_lower.startswith(b"<!doctype html") or content_lower.startswith(
                         b"<html"
                     ):
-                        confirm_match = re.search(rb"confirm=([a-zA-Z0-9_-]+)", content)
+                        confirm_match = _CONFIRM_RE.search(content)
                         if confirm_match:
                             confirm_url = (
                                 f"https://drive.usercontent.google.com/download?id={file_id}"
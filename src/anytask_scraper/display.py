@@ -134,6 +134,7 @@ _QUEUE_STATUS_COLORS: dict[str, str] = {
     "default": "dim",
     "primary": "blue",
 }
+_QUEUE_STATUS_STYLES = {token: f"bold {color}" for token, color in _QUEUE_STATUS_COLORS.items()}
 
 
 def display_queue(queue: ReviewQueue, console: Console | None = None) -> None:
@@ -164,8 +165,9 @@ def display_queue(queue: ReviewQueue, console: Console | None = None) -> None:
     table.add_column("Grade", justify="right", width=8)
 
     for i, entry in enumerate(queue.entries, 1):
-        color = _QUEUE_STATUS_COLORS.get(entry.status_color, "")
-        status_text = Text(entry.status_name, style=f"bold {color}" if color else "")
+        status_text = Text(
+            entry.status_name, style=_QUEUE_STATUS_STYLES.get(entry.status_color, "")
+        )
         table.add_row(
             str(i),
             entry.student_name,
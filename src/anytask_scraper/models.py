@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Course task."""
 
@@ -32,7 +32,7 @@ class Course:
     tasks: list[Task] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueEntry:
     """One queue row."""
 
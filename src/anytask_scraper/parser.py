@@ -25,7 +25,15 @@ logger = logging.getLogger(__name__)
 
 _DEADLINE_RE = re.compile(r"(\d{2}):(\d{2})\s+(\d{2})-(\d{2})-(\d{4})")
 _TASK_ID_RE = re.compile(r"collapse_(\d+)")
+_COLLAPSE_ID_RE = re.compile(r"^collapse_\d+$")
 _TASK_EDIT_RE = re.compile(r"/task/edit/(\d+)")
+_GROUP_ID_RE = re.compile(r"^collapse_group_\d+$")
+_GROUP_ID_PREFIX_RE = re.compile(r"^collapse_group_\d+")
+_CK_EDITOR_RE = re.compile(r"ck-editor")
+_TEXTAREA_RE = re.compile(
+    r"<textarea\b[^>]*(?<![\w-])id=[\"']id_task_text[\"'][^>]*>(.*?)</textarea>", re.S | re.I
+)
+_RAW_TEXT_TAGS = frozenset({"script", "style", "template"})
 
 
 def parse_course_page(html: str, course_id: int) -> Course:
@@ -41,7 +49,7 @@ def parse_course_page(html: str, course_id: int) -> Course:
         logger.warning("No tasks-tab found for course %d", course_id)
         return Course(course_id=course_id, title=title, teachers=teachers)
 
-    has_groups = tasks_tab.find("div", id=re.compile(r"^collapse_group_\d+$")) is not None
+    has_groups = tasks_tab.find("div", id=_GROUP_ID_RE) is not None
 
     tasks = _parse_teacher_tasks(tasks_tab) if has_groups else _parse_student_tasks(tasks_tab)
     logger.debug("Parsed %d tasks for course %d", len(tasks), course_id)
@@ -83,6 +91,10 @@ def _parse_student_tasks(tasks_tab: Tag) -> list[Task]:
     if tasks_table is None:
         return tasks
 
+    collapse_by_id: dict[str, Tag] = {}
+    for div in tasks_table.find_all("div", id=_COLLAPSE_ID_RE):
+        collapse_by_id.setdefault(str(div["id"]), div)
+
     for task_div in tasks_table.find_all("div", class_="tasks-list"):
         columns = [c for c in task_div.children if isinstance(c, Tag) and c.name == "div"]
         if len(columns) < 4:
@@ -111,7 +123,7 @@ def _parse_student_tasks(tasks_tab: Tag) -> list[Task]:
 
         description = ""
         if task_id:
-            collapse_div = tasks_table.find("div", id=f"collapse_{task_id}")
+            collapse_div = collapse_by_id.get(f"collapse_{task_id}")
             if collapse_div:
                 inner_div = collapse_div.find("div")
                 if inner_div:
@@ -139,7 +151,7 @@ def _parse_teacher_tasks(tasks_tab: Tag) -> list[Task]:
     if tasks_table is None:
         return tasks
 
-    for group_div in tasks_table.find_all("div", id=re.compile(r"^collapse_group_\d+")):
+    for group_div in tasks_table.find_all("div", id=_GROUP_ID_PREFIX_RE):
         group_header = _find_group_header(group_div)
         section_name = group_header if group_header else ""
 
@@ -198,19 +210,79 @@ def _extract_task_id_from_collapse(tag: Tag) -> int:
     return int(m.group(1)) if m else 0
 
 
+def _find_tag_end(text: str, pos: int) -> int:
+    """Return index of the ``>`` closing the tag at ``pos``, skipping quoted values."""
+    while True:
+        gt = text.find(">", pos)
+        if gt < 0:
+            return -1
+        dq = text.find('"', pos, gt)
+        sq = text.find("'", pos, gt)
+        quote = min(dq, sq) if dq >= 0 and sq >= 0 else max(dq, sq)
+        if quote < 0:
+            return gt
+        close = text.find(text[quote], quote + 1)
+        if close < 0:
+            return -1
+        pos = close + 1
+
+
 def strip_html(text: str) -> str:
-    """Strip HTML and decode entities."""
-    soup = BeautifulSoup(text, "lxml")
-    return unescape(soup.get_text(separator=" ", strip=True))
+    """Strip HTML and decode entities.
+
+    Every tag separates text with one space, stray end tags included, so malformed
+    markup like ``a</b>c`` gives ``a c`` where ``BeautifulSoup.get_text`` gave ``ac``.
+    """
+    parts: list[str] = []
+    find = text.find
+    lowered: str | None = None
+    end = len(text)
+    start = pos = 0
+    while True:
+        lt = find("<", pos)
+        if lt < 0:
+            break
+        nxt = text[lt + 1 : lt + 2]
+        if not nxt or not (nxt.isalpha() or nxt in "/!?"):
+            pos = lt + 1
+            continue
+        chunk = unescape(text[start:lt]).strip()
+        if chunk:
+            parts.append(chunk)
+        if text.startswith("<!--", lt):
+            close = find("-->", lt + 4)
+            start = pos = end if close < 0 else close + 3
+            continue
+        gt = _find_tag_end(text, lt)
+        if gt < 0:
+            start = end
+            break
+        start = pos = gt + 1
+        name = text[lt + 1 : gt].split(None, 1)
+        tag = name[0].rstrip("/").lower() if name else ""
+        if tag in _RAW_TEXT_TAGS:
+            if lowered is None:
+                lowered = text.lower()
+            close = lowered.find(f"</{tag}", pos)
+            gt = find(">", close) if close >= 0 else -1
+            start = pos = end if gt < 0 else gt + 1
+    chunk = unescape(text[start:]).strip()
+    if chunk:
+        parts.append(chunk)
+    return unescape(" ".join(parts))
 
 
 def parse_task_edit_page(html: str) -> str:
     """Extract task description from task edit page."""
+    m = _TEXTAREA_RE.search(html)
+    if m:
+        text = unescape(m.group(1)).replace("\r\n", "\n").replace("\r", "\n")
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").strip()
     soup = BeautifulSoup(html, "lxml")
     textarea = soup.find("textarea", id="id_task_text")
     if textarea:
         return textarea.decode_contents().strip()
-    ck_div = soup.find("div", class_=re.compile(r"ck-editor"))
+    ck_div = soup.find("div", class_=_CK_EDITOR_RE)
     if ck_div:
         return ck_div.decode_contents().strip()
     return ""
@@ -218,6 +290,10 @@ def parse_task_edit_page(html: str) -> str:
 
 def _parse_float(text: str) -> float | None:
     """Parse float or return ``None``."""
+    if not text or text == "-":
+        return None
+    if not text[0].isdigit() and text[0] not in "+-.":
+        return None
     try:
         return float(text)
     except (ValueError, TypeError):
@@ -413,6 +489,14 @@ _RU_MONTHS = {
     "Ноя": 11,
     "Дек": 12,
 }
+
+
+def _month_key(name: str) -> int:
+    """Pack a three-letter month abbreviation into one int."""
+    return (ord(name[0]) << 42) | (ord(name[1]) << 21) | ord(name[2])
+
+
+_RU_MONTHS_INT = {_month_key(k): v for k, v in _RU_MONTHS.items()}
 _COMMENT_TS_RE = re.compile(r"(\d{1,2})\s+(\S+)\s+(\d{2}):(\d{2})")
 
 
@@ -425,7 +509,7 @@ def _parse_comment_timestamp(text: str) -> datetime | None:
     month_name = m.group(2)
     hour = int(m.group(3))
     minute = int(m.group(4))
-    month = _RU_MONTHS.get(month_name)
+    month = _RU_MONTHS_INT.get(_month_key(month_name)) if len(month_name) == 3 else None
     if month is None:
         return None
     year = datetime.now().year
@@ -487,16 +571,20 @@ def _extract_urls_from_html(html: str) -> list[str]:
     if not html:
         return []
     urls: list[str] = []
+    seen: set[str] = set()
     soup = BeautifulSoup(html, "lxml")
     for a_tag in soup.find_all("a", href=True):
         href = str(a_tag["href"])
-        if href.startswith("http"):
+        if href.startswith("http") and href not in seen:
+            seen.add(href)
             urls.append(href)
     text = soup.get_text()
     for url_match in _URL_RE.finditer(text):
         url = url_match.group(0)
-        if url not in urls:
-            urls.append(url)
+        if url in seen:
+            continue
+        seen.add(url)
+        urls.append(url)
     return urls
 
 
@@ -512,6 +600,7 @@ def format_student_folder(name: str) -> str:
 
 
 _TABLE_ID_RE = re.compile(r"table_results_(\d+)")
+_BG_COLOR_RE = re.compile(r"background-color:\s*(#[0-9a-fA-F]+)")
 
 
 def parse_gradebook_page(html: str, course_id: int) -> Gradebook:
@@ -618,7 +707,7 @@ def _parse_gradebook_row(tr: Tag, task_titles: list[str]) -> GradebookEntry | No
             val = _parse_float(span.get_text(strip=True))
             scores[title] = val if val is not None else 0.0
             style = str(span.get("style", ""))
-            color_m = re.search(r"background-color:\s*(#[0-9a-fA-F]+)", style)
+            color_m = _BG_COLOR_RE.search(style)
             if color_m:
                 statuses[title] = color_m.group(1)
         a_tag = td.find("a", href=True)
@@ -3,23 +3,41 @@
 from __future__ import annotations
 
 import csv
-import json
 import logging
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 from anytask_scraper.models import Course, Gradebook, ReviewQueue, Submission, Task
 from anytask_scraper.parser import format_student_folder, strip_html
 
 logger = logging.getLogger(__name__)
 
+_WRITE_BUFFER = 1 << 20
+
+
+def _write_text(path: Path, text: str) -> None:
+    """Write text through a single large buffer."""
+    with path.open("w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER) as f:
+        f.write(text)
+
+
+def _write_json(path: Path, obj: object) -> None:
+    """Write a dataclass tree as indented UTF-8 JSON."""
+    path.write_bytes(
+        orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME)
+    )
+
 
 def save_course_json(course: Course, output_dir: Path | str = ".") -> Path:
     """Save course to JSON."""
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     path = output_dir / f"course_{course.course_id}.json"
-    path.write_text(json.dumps(asdict(course), indent=2, default=str, ensure_ascii=False))
+    _write_json(path, course)
     logger.info("Saved course JSON -> %s", path)
     return path
 
@@ -44,15 +62,21 @@ def save_course_markdown(course: Course, output_dir: Path | str = ".") -> Path:
     else:
         _md_student_tasks(course.tasks, lines)
 
-    path.write_text("\n".join(lines), encoding="utf-8")
+    _write_text(path, "\n".join(lines))
     logger.info("Saved course Markdown -> %s", path)
     return path
 
 
+@lru_cache(maxsize=1024)
+def _fmt_dt(dt: datetime, fmt: str = "%H:%M %d-%m-%Y") -> str:
+    """Format datetime, cached per unique value."""
+    return dt.strftime(fmt)
+
+
 def _md_deadline(task: Task) -> str:
     if task.deadline is None:
         return "-"
-    return task.deadline.strftime("%H:%M %d-%m-%Y")
+    return _fmt_dt(task.deadline)
 
 
 def _md_student_tasks(tasks: list[Task], lines: list[str]) -> None:
@@ -92,7 +116,7 @@ def save_queue_json(queue: ReviewQueue, output_dir: Path | str = ".") -> Path:
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     path = output_dir / f"queue_{queue.course_id}.json"
-    path.write_text(json.dumps(asdict(queue), indent=2, default=str, ensure_ascii=False))
+    _write_json(path, queue)
     logger.info("Saved queue JSON -> %s", path)
     return path
 
@@ -142,7 +166,7 @@ def save_queue_markdown(queue: ReviewQueue, output_dir: Path | str = ".") -> Pat
                         lines.append(f"  - Link: {link}")
                 lines.append("")
 
-    path.write_text("\n".join(lines), encoding="utf-8")
+    _write_text(path, "\n".join(lines))
     logger.info("Saved queue Markdown -> %s", path)
     return path
 
@@ -157,7 +181,7 @@ def save_course_csv(
 
     has_sections = any(t.section for t in course.tasks)
 
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
         writer = csv.writer(f)
         if has_sections:
             all_columns = ["#", "Title", "Section", "Max Score", "Deadline"]
@@ -173,7 +197,7 @@ def save_course_csv(
                     "Title": task.title,
                     "Section": task.section,
                     "Max Score": str(task.max_score) if task.max_score is not None else "",
-                    "Deadline": task.deadline.strftime("%Y-%m-%d %H:%M") if task.deadline else "",
+                    "Deadline": _fmt_dt(task.deadline, "%Y-%m-%d %H:%M") if task.deadline else "",
                 }
                 writer.writerow([row_data[c] for c in filtered_columns])
         else:
@@ -190,7 +214,7 @@ def save_course_csv(
                     "Title": task.title,
                     "Score": str(task.score) if task.score is not None else "",
                     "Status": task.status,
-                    "Deadline": task.deadline.strftime("%Y-%m-%d %H:%M") if task.deadline else "",
+                    "Deadline": _fmt_dt(task.deadline, "%Y-%m-%d %H:%M") if task.deadline else "",
                 }
                 writer.writerow([row_data[c] for c in filtered_columns])
     logger.info("Saved course CSV -> %s", path)
@@ -211,7 +235,7 @@ def save_queue_csv(
     else:
         filtered_columns = all_columns
 
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
         writer = csv.writer(f)
         writer.writerow(filtered_columns)
         for i, e in enumerate(queue.entries, 1):
@@ -259,7 +283,7 @@ def save_submissions_csv(
     else:
         filtered_columns = all_columns
 
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
         writer = csv.writer(f)
         writer.writerow(filtered_columns)
         for sub in subs:
@@ -283,6 +307,7 @@ def download_submission_files(
     client: object,
     submission: Submission,
     base_dir: Path | str,
+    max_workers: int = 8,
 ) -> dict[str, Path]:
     """Download files from submission comments."""
     from anytask_scraper.client import AnytaskClient
@@ -297,31 +322,62 @@ def download_submission_files(
     student_dir = base_dir / folder_name
     student_dir.mkdir(parents=True, exist_ok=True)
 
-    downloaded: dict[str, Path] = {}
     logger.debug("Downloading files for submission %d to %s", submission.issue_id, student_dir)
 
+    # (key, url, dest, is_colab) in the order results should be reported.
+    jobs: list[tuple[str, str, Path, bool]] = []
     for comment in submission.comments:
         for file_att in comment.files:
             dest = student_dir / file_att.filename
-            result = client.download_file(file_att.download_url, str(dest))
-            if result.success:
-                downloaded[file_att.filename] = dest
-            else:
-                logger.debug("Download failed: %s (%s)", file_att.filename, result.reason)
-
+            jobs.append((file_att.filename, file_att.download_url, dest, False))
         for link in comment.links:
             if "colab.research.google.com" not in link:
                 continue
-            nb_name = f"colab_{submission.issue_id}.ipynb"
-            dest = student_dir / nb_name
-            result = client.download_colab_notebook(link, str(dest))
+            dest = student_dir / f"colab_{submission.issue_id}.ipynb"
+            jobs.append((link, link, dest, True))
+
+    if not jobs:
+        return {}
+
+    results: list[Path | None] = [None] * len(jobs)
+
+    def _run(idx: int) -> None:
+        key, url, dest, is_colab = jobs[idx]
+        if not is_colab:
+            result = client.download_file(url, str(dest))
             if result.success:
-                downloaded[link] = dest
+                results[idx] = dest
             else:
-                url_file = student_dir / f"colab_{submission.issue_id}.url.txt"
-                url_file.write_text(link)
-                downloaded[link] = url_file
+                logger.debug("Download failed: %s (%s)", key, result.reason)
+            return
+        result = client.download_colab_notebook(url, str(dest))
+        if result.success:
+            results[idx] = dest
+        else:
+            url_file = student_dir / f"colab_{submission.issue_id}.url.txt"
+            url_file.write_text(url)
+            results[idx] = url_file
+
+    # Jobs writing the same destination run in order within one worker.
+    by_dest: dict[Path, list[int]] = {}
+    for idx, job in enumerate(jobs):
+        by_dest.setdefault(job[2], []).append(idx)
+
+    def _run_group(indices: list[int]) -> None:
+        for idx in indices:
+            _run(idx)
+
+    client.ensure_authenticated()
+    workers = max(1, min(max_workers, len(by_dest)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_group, indices) for indices in by_dest.values()]
+        for future in futures:
+            future.result()
 
+    downloaded: dict[str, Path] = {}
+    for (key, _url, _dest, _is_colab), path in zip(jobs, results, strict=True):
+        if path is not None:
+            downloaded[key] = path
     return downloaded
 
 
@@ -330,7 +386,7 @@ def save_gradebook_json(gradebook: Gradebook, output_dir: Path | str = ".") -> P
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     path = output_dir / f"gradebook_{gradebook.course_id}.json"
-    path.write_text(json.dumps(asdict(gradebook), indent=2, default=str, ensure_ascii=False))
+    _write_json(path, gradebook)
     logger.info("Saved gradebook JSON -> %s", path)
     return path
 
@@ -360,7 +416,7 @@ def save_gradebook_markdown(gradebook: Gradebook, output_dir: Path | str = ".")
             lines.append(f"| {i} | {entry.student_name} | {scores_str} | {entry.total_score} |")
         lines.append("")
 
-    path.write_text("\n".join(lines), encoding="utf-8")
+    _write_text(path, "\n".join(lines))
     logger.info("Saved gradebook Markdown -> %s", path)
     return path
 
@@ -373,11 +429,7 @@ def save_gradebook_csv(
     output_dir.mkdir(parents=True, exist_ok=True)
     path = output_dir / f"gradebook_{gradebook.course_id}.csv"
 
-    all_tasks: list[str] = []
-    for group in gradebook.groups:
-        for t in group.task_titles:
-            if t not in all_tasks:
-                all_tasks.append(t)
+    all_tasks = list(dict.fromkeys(t for group in gradebook.groups for t in group.task_titles))
 
     all_columns = ["Group", "Student"] + all_tasks + ["Total"]
 
@@ -386,7 +438,7 @@ def save_gradebook_csv(
     else:
         filtered_columns = all_columns
 
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
         writer = csv.writer(f)
         writer.writerow(filtered_columns)
         for group in gradebook.groups:
@@ -2,25 +2,53 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import tempfile
+import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import orjson
 from textual import work
 from textual.app import App
 from textual.binding import Binding
 
-from anytask_scraper.client import AnytaskClient
-from anytask_scraper.models import Course, Gradebook, ReviewQueue
+if TYPE_CHECKING:
+    from textual.timer import Timer
+
+    from anytask_scraper.client import AnytaskClient
+    from anytask_scraper.models import Course, Gradebook, ReviewQueue
 
 logger = logging.getLogger(__name__)
 
 CONFIG_DIR = Path.home() / ".config" / "anytask-scraper"
 COURSES_FILE = CONFIG_DIR / "courses.json"
 SESSION_FILE = ".anytask_session.json"
+SESSION_PATH = Path(SESSION_FILE)
+_SETTINGS_PATH = Path(".anytask_scraper_settings.json")
+
+_DOUBLE_PRESS_NS = 500_000_000
+_COURSE_IDS_FLUSH_DELAY = 5.0
+
+
+def _json_load(path: Path) -> object:
+    """Read and parse a JSON file."""
+    return orjson.loads(path.read_bytes())
 
-_DOUBLE_PRESS_MS = 500
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to a unique sibling temp file and rename it over *path*."""
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(data)
+    try:
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
 
 class AnytaskApp(App[None]):
@@ -34,31 +62,47 @@ class AnytaskApp(App[None]):
         Binding("ctrl+c", "ctrl_c", "Ctrl+C x2 Quit", show=False, priority=True),
     ]
 
-    client: AnytaskClient | None = None
-    courses: dict[int, Course] = {}
-    current_course: Course | None = None
-    session_path: str = ""
-    queue_cache: dict[int, ReviewQueue] = {}
-    gradebook_cache: dict[int, Gradebook] = {}
-
     def __init__(self) -> None:
         super().__init__()
-        self._last_ctrl_c: float = 0.0
+        self.client: AnytaskClient | None = None
+        self.courses: dict[int, Course] = {}
+        self.current_course: Course | None = None
+        self.session_path = ""
+        self.queue_cache: dict[int, ReviewQueue] = {}
+        self.gradebook_cache: dict[int, Gradebook] = {}
+        self._last_ctrl_c = 0
+        self._settings_cache: dict[str, object] | None = None
+        self._course_ids_cache: list[int] | None = None
+        self._course_ids_dirty = False
+        self._course_ids_payload = b""
+        self._course_ids_lock = threading.Lock()
+        self._config_dir_ready = False
+        self._course_ids_timer: Timer | None = None
 
     def on_mount(self) -> None:
+        self._load_startup_config()
+
+    @work(thread=True, exclusive=True, group="startup-config")
+    def _load_startup_config(self) -> None:
+        """Read settings and saved course IDs off the UI thread, then pick a screen."""
         settings = self._load_settings()
+        self.load_course_ids()
         if settings.get("auto_login_session", False):
             session_path = settings.get("session_file", SESSION_FILE)
             if isinstance(session_path, str):
-                session = Path(session_path)
-                if session.exists():
-                    self._auto_login(str(session))
-                    return
+                self.call_from_thread(self._auto_login, session_path)
+                return
+        self.call_from_thread(self._push_login_screen)
+
+    def _push_login_screen(self) -> None:
         from anytask_scraper.tui.screens.login import LoginScreen
 
         self.push_screen(LoginScreen())
 
     def on_unmount(self) -> None:
+        ids = self._take_pending_course_ids()
+        if ids is not None:
+            self._write_course_ids(ids)
         if self.client is not None:
             if self.session_path:
                 try:
@@ -69,31 +113,77 @@ class AnytaskApp(App[None]):
 
     def action_ctrl_c(self) -> None:
         """Double Ctrl+C to quit."""
-        now = time.monotonic()
-        elapsed_ms = (now - self._last_ctrl_c) * 1000
-        if elapsed_ms < _DOUBLE_PRESS_MS:
+        now = time.monotonic_ns()
+        if now - self._last_ctrl_c < _DOUBLE_PRESS_NS:
             self.exit()
         else:
             self._last_ctrl_c = now
             self.notify("Press Ctrl+C again to quit", timeout=2)
 
     def save_course_ids(self) -> None:
-        """Persist course IDs to config file."""
-        try:
-            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-            ids = list(self.courses.keys())
-            COURSES_FILE.write_text(json.dumps(ids, indent=2), encoding="utf-8")
-        except Exception:
-            logger.debug("Failed to save course IDs", exc_info=True)
+        """Mark course IDs for persistence; the write is debounced."""
+        self._course_ids_dirty = True
+        if self._course_ids_timer is None:
+            self._course_ids_timer = self.set_timer(_COURSE_IDS_FLUSH_DELAY, self.flush_course_ids)
+
+    def flush_course_ids(self) -> None:
+        """Write pending course IDs to the config file in a background thread."""
+        ids = self._take_pending_course_ids()
+        if ids is not None:
+            self._write_course_ids_worker(ids)
+
+    @work(thread=True, exclusive=True, group="course-ids")
+    def _write_course_ids_worker(self, ids: list[int]) -> None:
+        self._write_course_ids(ids)
+
+    def _write_course_ids(self, ids: list[int]) -> None:
+        """Atomically persist course IDs, skipping the write if nothing changed.
+
+        Writes are serialized, and a snapshot superseded by a newer one is dropped so a
+        late background flush cannot overwrite the final write made on unmount.
+        """
+        payload = orjson.dumps(ids)
+        with self._course_ids_lock:
+            if ids is not self._course_ids_cache or payload == self._course_ids_payload:
+                return
+            try:
+                if not self._config_dir_ready:
+                    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+                    self._config_dir_ready = True
+                _atomic_write_bytes(COURSES_FILE, payload)
+                self._course_ids_payload = payload
+            except Exception:
+                logger.debug("Failed to save course IDs", exc_info=True)
+
+    def _take_pending_course_ids(self) -> list[int] | None:
+        """Cancel the flush timer and return unsaved course IDs, if any."""
+        if self._course_ids_timer is not None:
+            self._course_ids_timer.stop()
+            self._course_ids_timer = None
+        if not self._course_ids_dirty:
+            return None
+        self._course_ids_dirty = False
+        self._course_ids_cache = list(self.courses)
+        return self._course_ids_cache
 
     def load_course_ids(self) -> list[int]:
-        """Load saved course IDs from config file."""
+        """Load saved course IDs, reading the config file only once."""
+        if self._course_ids_dirty:
+            return list(self.courses)
+        if self._course_ids_cache is None:
+            self._course_ids_cache = self._read_course_ids()
+        return self._course_ids_cache
+
+    def _read_course_ids(self) -> list[int]:
         try:
-            if not COURSES_FILE.exists():
-                return []
-            raw = json.loads(COURSES_FILE.read_text(encoding="utf-8"))
+            data = COURSES_FILE.read_bytes()
+            raw = orjson.loads(data)
             if isinstance(raw, list):
+                self._course_ids_payload = data
+                self._config_dir_ready = True
                 return [int(x) for x in raw if isinstance(x, int)]
+        except FileNotFoundError:
+            return []
         except Exception:
             logger.debug("Failed to load course IDs", exc_info=True)
         return []
@@ -106,13 +196,18 @@ class AnytaskApp(App[None]):
         self.save_course_ids()
 
     def _load_settings(self) -> dict[str, object]:
-        """Load settings from .anytask_scraper_settings.json."""
-        settings_path = Path(".anytask_scraper_settings.json")
+        """Load settings from .anytask_scraper_settings.json, cached after first read."""
+        if self._settings_cache is None:
+            self._settings_cache = self._read_settings()
+        return self._settings_cache
+
+    def _read_settings(self) -> dict[str, object]:
         try:
-            if settings_path.exists():
-                data = json.loads(settings_path.read_text(encoding="utf-8"))
-                if isinstance(data, dict):
-                    return data
+            data = _json_load(_SETTINGS_PATH)
+            if isinstance(data, dict):
+                return data
+        except FileNotFoundError:
+            return {}
         except Exception:
             logger.debug("Failed to load settings", exc_info=True)
         return {}
@@ -141,9 +236,4 @@ class AnytaskApp(App[None]):
         except Exception:
             logger.debug("Auto-login failed", exc_info=True)
 
-        def _push_login() -> None:
-            from anytask_scraper.tui.screens.login import LoginScreen
-
-            self.push_screen(LoginScreen())
-
-        self.call_from_thread(_push_login)
+        self.call_from_thread(self._push_login_screen)
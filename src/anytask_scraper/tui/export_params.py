@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from sys import intern
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportParam:
     """One selectable export parameter (column)."""
 
@@ -15,51 +16,49 @@ class ExportParam:
 
 
 TASKS_STUDENT_PARAMS = [
-    ExportParam("#", "Row number"),
-    ExportParam("Title", "Task title"),
-    ExportParam("Score", "Points received"),
-    ExportParam("Status", "Submission status"),
-    ExportParam("Deadline", "Due date"),
+    ExportParam(intern("#"), "Row number"),
+    ExportParam(intern("Title"), "Task title"),
+    ExportParam(intern("Score"), "Points received"),
+    ExportParam(intern("Status"), "Submission status"),
+    ExportParam(intern("Deadline"), "Due date"),
 ]
 
 TASKS_TEACHER_PARAMS = [
-    ExportParam("#", "Row number"),
-    ExportParam("Title", "Task title"),
-    ExportParam("Section", "Task section/group"),
-    ExportParam("Max Score", "Maximum points"),
-    ExportParam("Deadline", "Due date"),
+    ExportParam(intern("#"), "Row number"),
+    ExportParam(intern("Title"), "Task title"),
+    ExportParam(intern("Section"), "Task section/group"),
+    ExportParam(intern("Max Score"), "Maximum points"),
+    ExportParam(intern("Deadline"), "Due date"),
 ]
 
 QUEUE_PARAMS = [
-    ExportParam("#", "Row number"),
-    ExportParam("Student", "Student name"),
-    ExportParam("Task", "Task title"),
-    ExportParam("Status", "Review status"),
-    ExportParam("Reviewer", "Assigned reviewer"),
-    ExportParam("Updated", "Last update time"),
-    ExportParam("Grade", "Current grade"),
+    ExportParam(intern("#"), "Row number"),
+    ExportParam(intern("Student"), "Student name"),
+    ExportParam(intern("Task"), "Task title"),
+    ExportParam(intern("Status"), "Review status"),
+    ExportParam(intern("Reviewer"), "Assigned reviewer"),
+    ExportParam(intern("Updated"), "Last update time"),
+    ExportParam(intern("Grade"), "Current grade"),
 ]
 
 SUBMISSIONS_PARAMS = [
-    ExportParam("Issue ID", "Submission issue number"),
-    ExportParam("Task", "Task title"),
-    ExportParam("Student", "Student name"),
-    ExportParam("Reviewer", "Assigned reviewer"),
-    ExportParam("Status", "Review status"),
-    ExportParam("Grade", "Current grade"),
-    ExportParam("Max Score", "Maximum points"),
-    ExportParam("Deadline", "Due date"),
-    ExportParam("Comments", "Number of comments"),
+    ExportParam(intern("Issue ID"), "Submission issue number"),
+    ExportParam(intern("Task"), "Task title"),
+    ExportParam(intern("Student"), "Student name"),
+    ExportParam(intern("Reviewer"), "Assigned reviewer"),
+    ExportParam(intern("Status"), "Review status"),
+    ExportParam(intern("Grade"), "Current grade"),
+    ExportParam(intern("Max Score"), "Maximum points"),
+    ExportParam(intern("Deadline"), "Due date"),
+    ExportParam(intern("Comments"), "Number of comments"),
 ]
 
 
 def gradebook_params(task_titles: list[str]) -> list[ExportParam]:
     """Build gradebook parameters with dynamic task columns."""
-    params = [
-        ExportParam("Group", "Student group"),
-        ExportParam("Student", "Last name First name"),
+    return [
+        ExportParam(intern("Group"), "Student group"),
+        ExportParam(intern("Student"), "Last name First name"),
+        *[ExportParam(title, f"Task: {title}") for title in task_titles],
+        ExportParam(intern("Total"), "Total score"),
     ]
-    for title in task_titles:
-        params.append(ExportParam(title, f"Task: {title}"))
-    params.append(ExportParam("Total", "Total score"))
-    return params
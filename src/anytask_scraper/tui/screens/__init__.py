@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
-from anytask_scraper.tui.screens.login import LoginScreen
-from anytask_scraper.tui.screens.main import MainScreen
-from anytask_scraper.tui.screens.submission import SubmissionScreen
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from anytask_scraper.tui.screens.login import LoginScreen
+    from anytask_scraper.tui.screens.main import MainScreen
+    from anytask_scraper.tui.screens.submission import SubmissionScreen
 
 __all__ = [
     "LoginScreen",
     "MainScreen",
     "SubmissionScreen",
 ]
+
+_SCREEN_MODULES = {
+    "LoginScreen": "login",
+    "MainScreen": "main",
+    "SubmissionScreen": "submission",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import screen classes on first access so the login screen loads alone."""
+    module = _SCREEN_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
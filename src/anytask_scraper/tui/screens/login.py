@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 
 from textual import on, work
 from textual.app import ComposeResult
@@ -13,14 +12,27 @@ from textual.screen import Screen
 from textual.widgets import Button, Input, Label
 
 from anytask_scraper.client import AnytaskClient, LoginError
-from anytask_scraper.tui.app import SESSION_FILE
+from anytask_scraper.tui.app import SESSION_FILE, SESSION_PATH
 
 logger = logging.getLogger(__name__)
 
 
+def _session_file_readable() -> bool:
+    """Return True if the saved session file can be opened."""
+    try:
+        with SESSION_PATH.open("rb"):
+            return True
+    except OSError:
+        return False
+
+
 class LoginScreen(Screen[None]):
     """Minimal login screen - credentials or saved session."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._session_available = _session_file_readable()
+
     def compose(self) -> ComposeResult:
         with Center(), Vertical(id="login-box"):
             yield Label("ANYTASK", id="login-title")
@@ -35,8 +47,7 @@ class LoginScreen(Screen[None]):
 
             with Vertical(id="btn-row"):
                 yield Button("Login", variant="primary", id="login-btn")
-                session = Path(SESSION_FILE)
-                if session.exists():
+                if self._session_available:
                     yield Button(
                         "Continue with saved session",
                         variant="default",
@@ -46,32 +57,33 @@ class LoginScreen(Screen[None]):
             yield Label("", id="login-status")
 
     def on_mount(self) -> None:
-        self.query_one("#username", Input).focus()
+        focusable = ["username", "password", "login-btn"]
+        if self._session_available:
+            focusable.append("session-btn")
+        n = len(focusable)
+        self._nav: dict[str, tuple[str, str]] = {
+            wid: (f"#{focusable[i - 1]}", f"#{focusable[(i + 1) % n]}")
+            for i, wid in enumerate(focusable)
+        }
+        self._username_input = self.query_one("#username", Input)
+        self._password_input = self.query_one("#password", Input)
+        self._status_label = self.query_one("#login-status", Label)
+        self._username_input.focus()
 
     def on_key(self, event: Key) -> None:
-        if event.key not in ("up", "down"):
+        key = event.key
+        if key != "up" and key != "down":
             return
-
-        focusable: list[str] = ["#username", "#password", "#login-btn"]
-        if self.query("#session-btn"):
-            focusable.append("#session-btn")
-
         focused = self.focused
-        if focused is None:
+        neighbours = self._nav.get(focused.id or "") if focused is not None else None
+        if neighbours is None:
             return
-
-        current_id = f"#{focused.id}"
-        if current_id not in focusable:
-            return
-
         event.prevent_default()
-        idx = focusable.index(current_id)
-        next_idx = (idx + 1) % len(focusable) if event.key == "down" else (idx - 1) % len(focusable)
-        self.query_one(focusable[next_idx]).focus()
+        self.query_one(neighbours[0] if key == "up" else neighbours[1]).focus()
 
     @on(Input.Submitted, "#username")
     def _username_submitted(self) -> None:
-        self.query_one("#password", Input).focus()
+        self._password_input.focus()
 
     @on(Input.Submitted, "#password")
     def _password_submitted(self) -> None:
@@ -79,8 +91,8 @@ class LoginScreen(Screen[None]):
 
     @on(Button.Pressed, "#login-btn")
     def _handle_login(self) -> None:
-        username = self.query_one("#username", Input).value.strip()
-        password = self.query_one("#password", Input).value.strip()
+        username = self._username_input.value.strip()
+        password = self._password_input.value.strip()
         if not username or not password:
             self._set_status("Enter username and password", "error")
             return
@@ -89,12 +101,8 @@ class LoginScreen(Screen[None]):
 
     @on(Button.Pressed, "#session-btn")
     def _handle_session(self) -> None:
-        path = Path(SESSION_FILE)
-        if not path.exists():
-            self._set_status("Session file not found", "error")
-            return
         self._set_status("Loading session...", "info")
-        self._do_load_session(str(path))
+        self._do_load_session(SESSION_FILE)
 
     @work(thread=True)
     def _do_login(self, username: str, password: str) -> None:
@@ -135,7 +143,7 @@ class LoginScreen(Screen[None]):
             self.app.call_from_thread(self._set_status, f"Error: {e}", "error")
 
     def _set_status(self, message: str, kind: str = "info") -> None:
-        label = self.query_one("#login-status", Label)
+        label = self._status_label
         label.update(message)
         label.remove_class("error", "success", "info")
         label.add_class(kind)
@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+import threading
 import unicodedata
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
 import httpx
+import orjson
 from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.dom import DOMNode
+from textual.events import Key
+from textual.markup import escape
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
@@ -30,7 +40,9 @@ from textual.widgets import (
     TabbedContent,
     TabPane,
 )
-from textual.widgets.option_list import Option
+from textual.widgets.data_table import RowKey
+from textual.widgets.option_list import Option, OptionDoesNotExist
+from textual.worker import get_current_worker
 
 from anytask_scraper.models import (
     Course,
@@ -79,6 +91,14 @@ from anytask_scraper.tui.widgets.param_selector import ParameterSelector
 
 logger = logging.getLogger(__name__)
 
+_FILTER_DEBOUNCE = 0.08
+_PREFETCH_DELAY = 0.15
+_PREFETCH_RADIUS = 2
+_SUBMISSION_CACHE_SIZE = 512
+_EXPORT_FETCH_WORKERS = 4
+_DEADLINE_SOON = timedelta(days=3)
+_ID_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9]+")
+
 _STATUS_STYLES: dict[str, str] = {
     "Зачтено": "bold green",
     "На проверке": "bold yellow",
@@ -86,6 +106,41 @@ _STATUS_STYLES: dict[str, str] = {
     "Новый": "dim",
 }
 
+_STATUS_LINE_STYLES: dict[str, str] = {
+    "error": "bold red",
+    "warning": "bold yellow",
+    "success": "bold green",
+    "info": "dim",
+}
+
+_KEY_BAR_COMMON = (
+    "[dim]ctrl+q[/dim] Quit  [dim]a[/dim] Add  [dim]x[/dim] Remove  [dim]ctrl+l[/dim] Logout"
+)
+_KEY_BAR_FILTER_HINTS = Text.from_markup(
+    "[dim]/[/dim] Filter  "
+    "[dim]r[/dim] Reset  "
+    "[dim]u[/dim] Undo  "
+    "[dim]?[/dim] Help  " + _KEY_BAR_COMMON
+)
+_KEY_BAR_HINTS: dict[str, Text] = {
+    "tasks-tab": _KEY_BAR_FILTER_HINTS,
+    "queue-tab": _KEY_BAR_FILTER_HINTS,
+    "gradebook-tab": _KEY_BAR_FILTER_HINTS,
+    "export-tab": Text.from_markup(
+        "[dim]ctrl+\u2191/\u2193[/dim] Navigate  [dim]?[/dim] Help  " + _KEY_BAR_COMMON
+    ),
+}
+_KEY_BAR_DEFAULT = Text.from_markup(_KEY_BAR_COMMON)
+
+_VIM_NAV_WIDGETS = (OptionList, DataTable)
+
+_EXPORT_FORMATS: dict[str, str] = {
+    "json-radio": "json",
+    "md-radio": "markdown",
+    "csv-radio": "csv",
+    "files-radio": "files",
+}
+
 _QUEUE_STATUS_COLORS: dict[str, str] = {
     "success": "bold green",
     "warning": "bold yellow",
@@ -96,6 +151,31 @@ _QUEUE_STATUS_COLORS: dict[str, str] = {
 }
 
 
+_HELP_TEXT = (
+    "[bold]Navigation[/bold]\n"
+    "  Tab / Shift+Tab   cycle focus\n"
+    "  h / l             left / right pane\n"
+    "  j / k             up / down\n"
+    "  1 / 2 / 3 / 4     switch tabs\n"
+    "\n"
+    "[bold]Filters[/bold]\n"
+    "  /                 focus filter\n"
+    "  Ctrl+\u2190/\u2192          cycle filter fields\n"
+    "  Ctrl+\u2191            jump to filters\n"
+    "  Ctrl+\u2193            jump to table\n"
+    "  r                 reset filters\n"
+    "  u                 undo reset\n"
+    "\n"
+    "[bold]Actions[/bold]\n"
+    "  a                 add course\n"
+    "  x                 remove course\n"
+    "  Enter             select / open\n"
+    "  Esc               back / dismiss\n"
+    "  Ctrl+Q            quit\n"
+    "  Ctrl+C \u00d72         quit"
+)
+
+
 def make_safe_id(name: str) -> str:
     """Convert arbitrary string to valid Textual widget ID fragment.
 
@@ -103,10 +183,8 @@ def make_safe_id(name: str) -> str:
     """
     normalized = unicodedata.normalize("NFKD", name)
     ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
-    safe = re.sub(r"[^a-zA-Z0-9]+", "-", ascii_only).strip("-").lower()
+    safe = _ID_UNSAFE_RE.sub("-", ascii_only).strip("-").lower()
     if not safe:
-        import hashlib
-
         safe = "h" + hashlib.md5(name.encode()).hexdigest()[:10]
     if safe and safe[0].isdigit():
         safe = "n" + safe
@@ -123,6 +201,24 @@ def _parse_mark(mark: str) -> float:
 
 def _parse_update_time(time_str: str) -> datetime:
     """Parse update_time string (DD-MM-YYYY or DD-MM-YYYY HH:MM) to datetime."""
+    if len(time_str) in (10, 16) and time_str[2:3] == time_str[5:6] == "-":
+        digits = time_str[:2] + time_str[3:5] + time_str[6:10] + time_str[11:13] + time_str[14:]
+        if (
+            digits.isascii()
+            and digits.isdigit()
+            and time_str[10:11] in ("", " ")
+            and time_str[13:14] in ("", ":")
+        ):
+            try:
+                return datetime(
+                    int(time_str[6:10]),
+                    int(time_str[3:5]),
+                    int(time_str[:2]),
+                    int(time_str[11:13] or 0),
+                    int(time_str[14:] or 0),
+                )
+            except ValueError:
+                return datetime.min
     for fmt in ("%d-%m-%Y %H:%M", "%d-%m-%Y"):
         try:
             return datetime.strptime(time_str, fmt)
@@ -131,21 +227,135 @@ def _parse_update_time(time_str: str) -> datetime:
     return datetime.min
 
 
+_QUEUE_SORT_KEYS: dict[int, Callable[[QueueEntry], Any]] = {
+    1: lambda e: e.student_name.lower(),
+    2: lambda e: e.task_title.lower(),
+    3: lambda e: e.status_name.lower(),
+    4: lambda e: e.responsible_name.lower(),
+    5: lambda e: _parse_update_time(e.update_time),
+    6: lambda e: _parse_mark(e.mark),
+}
+
+
+def _queue_entry_from_row(row: dict[str, object]) -> QueueEntry:
+    """Build a ``QueueEntry`` from one queue AJAX row."""
+    get = row.get
+    return QueueEntry(
+        str(get("student_name", "")),
+        str(get("student_url", "")),
+        str(get("task_title", "")),
+        str(get("update_time", "")),
+        str(get("mark", "")),
+        str(get("status_color", "default")),
+        str(get("status_name", "")),
+        str(get("responsible_name", "")),
+        str(get("responsible_url", "")),
+        bool(get("has_issue_access", False)),
+        str(get("issue_url", "")),
+    )
+
+
+def _load_submission(client: Any, issue_url: str) -> Submission | None:
+    """Fetch and parse one submission page; ``None`` if it has no issue ID."""
+    html = client.fetch_submission_page(issue_url)
+    issue_id = extract_issue_id_from_breadcrumb(html)
+    return parse_submission_page(html, issue_id) if issue_id else None
+
+
+def _gradebook_task_titles(groups: Sequence[GradebookGroup]) -> list[str]:
+    """Task titles across gradebook groups in first-seen order."""
+    return list(dict.fromkeys(t for g in groups for t in g.task_titles))
+
+
+def _queue_option_lists(entries: Sequence[QueueEntry]) -> tuple[list[str], ...]:
+    """Sorted distinct students, tasks, statuses and reviewers of queue entries."""
+    students: set[str] = set()
+    tasks: set[str] = set()
+    statuses: set[str] = set()
+    reviewers: set[str] = set()
+    for e in entries:
+        students.add(e.student_name)
+        tasks.add(e.task_title)
+        statuses.add(e.status_name)
+        reviewers.add(e.responsible_name)
+    for values in (students, tasks, statuses, reviewers):
+        values.discard("")
+    return tuple(sorted(values) for values in (students, tasks, statuses, reviewers))
+
+
+def _filter_queue_entries(
+    entries: Sequence[QueueEntry], filters: dict[str, str] | None
+) -> list[QueueEntry]:
+    """Apply export task/status/reviewer filters to queue entries in one pass."""
+    if not filters:
+        return list(entries)
+    task = filters.get("task")
+    status = filters.get("status")
+    reviewer = filters.get("reviewer")
+    return [
+        e
+        for e in entries
+        if (not task or e.task_title == task)
+        and (not status or e.status_name == status)
+        and (not reviewer or e.responsible_name == reviewer)
+    ]
+
+
+_ROW_NUMBERS: list[str] = ["0"]
+
+
+def _row_numbers(count: int) -> list[str]:
+    """Return shared row number labels indexable up to ``count``."""
+    numbers = _ROW_NUMBERS
+    if len(numbers) <= count:
+        numbers.extend(map(str, range(len(numbers), count + 1)))
+    return numbers
+
+
+_STATUS_TEXTS: dict[str, Text] = {k: Text(k, style=v) for k, v in _STATUS_STYLES.items()}
+
+
 def _styled_status(status: str) -> Text:
-    style = _STATUS_STYLES.get(status, "")
-    return Text(status or "-", style=style)
+    """Return a shared styled status cell; callers must not mutate it."""
+    text = _STATUS_TEXTS.get(status)
+    if text is None:
+        text = _STATUS_TEXTS[status] = Text(status or "-")
+    return text
+
+
+@lru_cache(maxsize=64)
+def _styled_queue_status(name: str, color: str) -> Text:
+    """Return a shared queue status cell; callers must not mutate it."""
+    return Text(name, style=_QUEUE_STATUS_COLORS.get(color, ""))
+
+
+def _format_timestamp(ts: datetime) -> str:
+    """Format as ``DD.MM.YYYY HH:MM`` without going through strftime."""
+    return f"{ts.day:02d}.{ts.month:02d}.{ts.year} {ts.hour:02d}:{ts.minute:02d}"
+
+
+_NO_DEADLINE = Text("-", style="dim")
 
 
-def _styled_deadline(deadline: datetime | None) -> Text:
+@lru_cache(maxsize=512)
+def _deadline_cell(deadline: datetime, style: str) -> Text:
+    """Return a shared deadline cell; callers must not mutate it."""
+    return Text(f"{deadline.day:02d}.{deadline.month:02d}.{deadline.year}", style=style)
+
+
+def _styled_deadline(deadline: datetime | None, now: datetime, soon: datetime) -> Text:
     if deadline is None:
-        return Text("-", style="dim")
-    label = deadline.strftime("%d.%m.%Y")
-    now = datetime.now()
+        return _NO_DEADLINE
     if deadline < now:
-        return Text(label, style="dim strike")
-    if deadline < now + timedelta(days=3):
-        return Text(label, style="bold yellow")
-    return Text(label)
+        return _deadline_cell(deadline, "dim strike")
+    if deadline < soon:
+        return _deadline_cell(deadline, "bold yellow")
+    return _deadline_cell(deadline, "")
+
+
+def _is_within(ancestor: DOMNode, node: DOMNode) -> bool:
+    """Return True if *node* is *ancestor* or one of its descendants."""
+    return node is ancestor or ancestor in node.ancestors
 
 
 def _format_score(task: Task) -> str:
@@ -193,6 +403,7 @@ class MainScreen(Screen[None]):
         self.all_queue_entries: list[QueueEntry] = []
         self.filtered_queue_entries: list[QueueEntry] = []
         self._queue_loaded_for: int | None = None
+        self._last_active_tab: str | None = None
         self._task_filter_undo: dict[str, Any] | None = None
         self._queue_filter_undo: dict[str, Any] | None = None
         self._queue_sort_column: int | None = None
@@ -206,6 +417,45 @@ class MainScreen(Screen[None]):
         self._gb_all_tasks: list[str] = []
         self._help_visible = False
         self._export_preload_token = 0
+        self._export_filters_dirty = True
+        self._task_lc_source: list[Task] | None = None
+        self._task_title_lc: list[str] = []
+        self._queue_lc_source: list[QueueEntry] | None = None
+        self._queue_student_lc: list[str] = []
+        self._gb_lc_source: list[GradebookGroup] | None = None
+        self._gb_student_lc: list[list[str]] = []
+        self._queue_task_lc: list[str] = []
+        self._task_by_key: dict[RowKey, Task] = {}
+        self._queue_index_source: list[QueueEntry] | None = None
+        self._queue_by_url: dict[str, QueueEntry] = {}
+        self._queue_sort_source: list[QueueEntry] | None = None
+        self._queue_sort_keys: dict[int, dict[int, Any]] = {}
+        self._task_options_source: list[Task] | None = None
+        self._task_cells_source: list[Task] | None = None
+        self._task_cells: dict[int, tuple[Text | str, ...]] = {}
+        self._task_options: tuple[list[str], ...] = ([], [], [])
+        self._queue_options_source: list[QueueEntry] | None = None
+        self._queue_options: tuple[list[str], ...] = ([], [], [], [])
+        self._gb_options_source: list[GradebookGroup] | None = None
+        self._gb_options: tuple[list[str], ...] = ([], [])
+        self._task_filter: TaskFilterBar.Changed | None = None
+        self._task_filter_timer: Timer | None = None
+        self._task_filter_state: tuple[str, ...] | None = None
+        self._task_match_source: list[Task] | None = None
+        self._task_matches: list[int] = []
+        self._queue_filter: QueueFilterBar.Changed | None = None
+        self._queue_filter_timer: Timer | None = None
+        self._gb_filter: GradebookFilterBar.Changed | None = None
+        self._gb_filter_timer: Timer | None = None
+        self._queue_prefetch_timer: Timer | None = None
+        self._queue_detail_sub: Submission | None = None
+        self._deadline_now = datetime.now()
+        self._deadline_soon = self._deadline_now + _DEADLINE_SOON
+        self._submission_lock = threading.Lock()
+        self._inflight: dict[str, Future[Submission | None]] = {}
+        self._queue_filter_state: tuple[str, ...] | None = None
+        self._queue_match_source: list[QueueEntry] | None = None
+        self._queue_matches: list[int] = []
 
     def compose(self) -> ComposeResult:
         client = getattr(self.app, "client", None)
@@ -340,23 +590,50 @@ class MainScreen(Screen[None]):
         yield Static("", id="key-bar")
 
     def on_mount(self) -> None:
-        table = self.query_one("#task-table", DataTable)
+        self._course_add_bar = self.query_one("#course-add-bar", Container)
+        self._course_id_input = self.query_one("#course-id-input", Input)
+        self._course_list = self.query_one("#course-list", OptionList)
+        self._detail_scroll = self.query_one("#detail-scroll", VerticalScroll)
+        self._export_preview = self.query_one("#export-preview-content", Static)
+        self._export_status_label = self.query_one("#export-status-label", Label)
+        self._export_type_set = self.query_one("#export-type-set", RadioSet)
+        self._export_task_select = self.query_one("#export-filter-task", Select)
+        self._export_status_select = self.query_one("#export-filter-status", Select)
+        self._export_reviewer_select = self.query_one("#export-filter-reviewer", Select)
+        self._format_set = self.query_one("#format-set", RadioSet)
+        self._gb_filter_bar = self.query_one("#gb-filter-bar", GradebookFilterBar)
+        self._gradebook_info_label = self.query_one("#gradebook-info-label", Label)
+        self._gradebook_table = self.query_one("#gradebook-table", DataTable)
+        self._help_panel = self.query_one("#help-panel", Static)
+        self._output_dir_input = self.query_one("#output-dir-input", Input)
+        self._param_selector = self.query_one("#param-selector", ParameterSelector)
+        self._key_bar = self.query_one("#key-bar", Static)
+        self._tabs = self.query_one("#main-tabs", TabbedContent)
+        self._queue_filter_bar = self.query_one("#queue-filter-bar", QueueFilterBar)
+        self._queue_detail_scroll = self.query_one("#queue-detail-scroll", VerticalScroll)
+        self._queue_info_label = self.query_one("#queue-info-label", Label)
+        self._queue_table = self.query_one("#queue-table", DataTable)
+        self._status_line = self.query_one("#status-line", Static)
+        self._task_filter_bar = self.query_one("#task-filter-bar", TaskFilterBar)
+        self._task_table = self.query_one("#task-table", DataTable)
+
+        table = self._task_table
         table.cursor_type = "row"
         table.zebra_stripes = True
         self._setup_task_table_columns()
         self._rebuild_task_table()
 
-        qtable = self.query_one("#queue-table", DataTable)
+        qtable = self._queue_table
         qtable.cursor_type = "row"
         qtable.zebra_stripes = True
         qtable.add_columns("#", "Student", "Task", "Status", "Reviewer", "Updated", "Grade")
 
-        gtable = self.query_one("#gradebook-table", DataTable)
+        gtable = self._gradebook_table
         gtable.cursor_type = "row"
         gtable.zebra_stripes = True
         self._rebuild_gradebook_table([])
 
-        self.query_one("#course-list", OptionList).focus()
+        self._course_list.focus()
 
         saved_ids = self.app.load_course_ids()  # type: ignore[attr-defined]
         for cid in saved_ids:
@@ -364,110 +641,80 @@ class MainScreen(Screen[None]):
                 self._fetch_course(cid)
         self._update_key_bar()
 
+    def _active_tab(self) -> str:
+        """Return the id of the active main tab."""
+        return self._tabs.active
+
     def _update_key_bar(self) -> None:
         """Update the key hints bar based on current context."""
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        active = tabs.active
-
-        common = (
-            "[dim]ctrl+q[/dim] Quit  "
-            "[dim]a[/dim] Add  "
-            "[dim]x[/dim] Remove  "
-            "[dim]ctrl+l[/dim] Logout"
-        )
-
-        if active in ("tasks-tab", "queue-tab", "gradebook-tab"):
-            hints = (
-                "[dim]/[/dim] Filter  "
-                "[dim]r[/dim] Reset  "
-                "[dim]u[/dim] Undo  "
-                "[dim]?[/dim] Help  " + common
-            )
-        elif active == "export-tab":
-            hints = "[dim]ctrl+\u2191/\u2193[/dim] Navigate  [dim]?[/dim] Help  " + common
-        else:
-            hints = common
-
-        self.query_one("#key-bar", Static).update(hints)
+        self._key_bar.update(_KEY_BAR_HINTS.get(self._active_tab(), _KEY_BAR_DEFAULT))
 
     def _show_status(self, message: str, kind: str = "info", timeout: float = 4) -> None:
         """Show an inline message in the status line."""
-        line = self.query_one("#status-line", Static)
-        style_map = {
-            "error": "[bold red]",
-            "warning": "[bold yellow]",
-            "success": "[bold green]",
-            "info": "[dim]",
-        }
-        prefix = style_map.get(kind, "[dim]")
-        close = prefix.replace("[", "[/")
-        line.update(f"{prefix}{message}{close}")
+        style = _STATUS_LINE_STYLES.get(kind, _STATUS_LINE_STYLES["info"])
+        self._status_line.update(Text(message, style=style))
         if timeout > 0:
             self.set_timer(timeout, self._clear_status)
 
     def _clear_status(self) -> None:
-        self.query_one("#status-line", Static).update("")
+        self._status_line.update("")
 
     def action_toggle_help(self) -> None:
-        panel = self.query_one("#help-panel", Static)
+        panel = self._help_panel
         self._help_visible = not self._help_visible
         if self._help_visible:
-            panel.update(
-                "[bold]Navigation[/bold]\n"
-                "  Tab / Shift+Tab   cycle focus\n"
-                "  h / l             left / right pane\n"
-                "  j / k             up / down\n"
-                "  1 / 2 / 3 / 4     switch tabs\n"
-                "\n"
-                "[bold]Filters[/bold]\n"
-                "  /                 focus filter\n"
-                "  Ctrl+\u2190/\u2192          cycle filter fields\n"
-                "  Ctrl+\u2191            jump to filters\n"
-                "  Ctrl+\u2193            jump to table\n"
-                "  r                 reset filters\n"
-                "  u                 undo reset\n"
-                "\n"
-                "[bold]Actions[/bold]\n"
-                "  a                 add course\n"
-                "  x                 remove course\n"
-                "  Enter             select / open\n"
-                "  Esc               back / dismiss\n"
-                "  Ctrl+Q            quit\n"
-                "  Ctrl+C \u00d72         quit"
-            )
+            panel.update(_HELP_TEXT)
             panel.add_class("visible")
         else:
             panel.update("")
             panel.remove_class("visible")
 
     def action_tab_tasks(self) -> None:
-        self.query_one("#main-tabs", TabbedContent).active = "tasks-tab"
-        self.query_one("#task-table", DataTable).focus()
+        self._tabs.active = "tasks-tab"
+        self._task_table.focus()
 
     def action_tab_queue(self) -> None:
-        self.query_one("#main-tabs", TabbedContent).active = "queue-tab"
-        self.query_one("#queue-table", DataTable).focus()
+        self._tabs.active = "queue-tab"
+        self._queue_table.focus()
 
     def action_tab_export(self) -> None:
-        self.query_one("#main-tabs", TabbedContent).active = "export-tab"
-        self.query_one("#export-type-set", RadioSet).focus()
+        self._tabs.active = "export-tab"
+        self._export_type_set.focus()
 
     def action_tab_gradebook(self) -> None:
-        self.query_one("#main-tabs", TabbedContent).active = "gradebook-tab"
-        self.query_one("#gradebook-table", DataTable).focus()
+        self._tabs.active = "gradebook-tab"
+        self._gradebook_table.focus()
 
     @on(TabbedContent.TabActivated, "#main-tabs")
     def _tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        pane_id = event.pane.id
+        if pane_id == self._last_active_tab:
+            return
+        self._last_active_tab = pane_id
+        self._flush_filter_timers()
         self._update_key_bar()
-        if event.pane.id == "queue-tab":
+        if pane_id == "queue-tab":
             self._maybe_load_queue()
-        elif event.pane.id == "gradebook-tab":
+        elif pane_id == "gradebook-tab":
             self._maybe_load_gradebook()
+        elif pane_id == "export-tab" and self._export_filters_dirty:
+            self._sync_export_tab()
+
+    def _flush_filter_timers(self) -> None:
+        """Apply any filter edit still waiting on its debounce timer."""
+        if self._task_filter_timer is not None:
+            self._task_filter_timer.stop()
+            self._apply_task_filter()
+        if self._queue_filter_timer is not None:
+            self._queue_filter_timer.stop()
+            self._apply_queue_filter()
+        if self._gb_filter_timer is not None:
+            self._gb_filter_timer.stop()
+            self._apply_gb_filter()
 
     def _get_focus_order(self) -> list[str]:
         """Return IDs of focusable zones for current tab."""
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        active = tabs.active
+        active = self._active_tab()
         zones = ["#course-list"]
         if active == "tasks-tab":
             zones += ["#task-table", "#task-filter-bar"]
@@ -491,28 +738,27 @@ class MainScreen(Screen[None]):
     def action_cycle_focus(self) -> None:
         focused = self.focused
         if focused is not None:
-            tabs = self.query_one("#main-tabs", TabbedContent)
-            active = tabs.active
+            active = self._active_tab()
             if active == "tasks-tab":
-                task_bar = self.query_one("#task-filter-bar", TaskFilterBar)
-                if focused in task_bar.walk_children():
+                task_bar = self._task_filter_bar
+                if _is_within(task_bar, focused):
                     if task_bar.focus_next_filter():
                         return
-                    self.query_one("#task-table", DataTable).focus()
+                    self._task_table.focus()
                     return
             elif active == "queue-tab":
-                queue_bar = self.query_one("#queue-filter-bar", QueueFilterBar)
-                if focused in queue_bar.walk_children():
+                queue_bar = self._queue_filter_bar
+                if _is_within(queue_bar, focused):
                     if queue_bar.focus_next_filter():
                         return
-                    self.query_one("#queue-table", DataTable).focus()
+                    self._queue_table.focus()
                     return
             elif active == "gradebook-tab":
-                gb_bar = self.query_one("#gb-filter-bar", GradebookFilterBar)
-                if focused in gb_bar.walk_children():
+                gb_bar = self._gb_filter_bar
+                if _is_within(gb_bar, focused):
                     if gb_bar.focus_next_filter():
                         return
-                    self.query_one("#gradebook-table", DataTable).focus()
+                    self._gradebook_table.focus()
                     return
 
         zones = self._get_focus_order()
@@ -523,28 +769,27 @@ class MainScreen(Screen[None]):
     def action_cycle_focus_back(self) -> None:
         focused = self.focused
         if focused is not None:
-            tabs = self.query_one("#main-tabs", TabbedContent)
-            active = tabs.active
+            active = self._active_tab()
             if active == "tasks-tab":
-                task_bar = self.query_one("#task-filter-bar", TaskFilterBar)
-                if focused in task_bar.walk_children():
+                task_bar = self._task_filter_bar
+                if _is_within(task_bar, focused):
                     if task_bar.focus_prev_filter():
                         return
-                    self.query_one("#course-list", OptionList).focus()
+                    self._course_list.focus()
                     return
             elif active == "queue-tab":
-                queue_bar = self.query_one("#queue-filter-bar", QueueFilterBar)
-                if focused in queue_bar.walk_children():
+                queue_bar = self._queue_filter_bar
+                if _is_within(queue_bar, focused):
                     if queue_bar.focus_prev_filter():
                         return
-                    self.query_one("#course-list", OptionList).focus()
+                    self._course_list.focus()
                     return
             elif active == "gradebook-tab":
-                gb_bar = self.query_one("#gb-filter-bar", GradebookFilterBar)
-                if focused in gb_bar.walk_children():
+                gb_bar = self._gb_filter_bar
+                if _is_within(gb_bar, focused):
                     if gb_bar.focus_prev_filter():
                         return
-                    self.query_one("#course-list", OptionList).focus()
+                    self._course_list.focus()
                     return
 
         zones = self._get_focus_order()
@@ -553,83 +798,82 @@ class MainScreen(Screen[None]):
         self._focus_zone(zones[prev_idx])
 
     def _find_current_zone(self, zones: list[Any]) -> int:
-        focused = self.focused
-        if focused is None:
-            return -1
-        for i, zone_id in enumerate(zones):
-            if isinstance(zone_id, str):
-                try:
-                    widget = self.query_one(zone_id)
-                except Exception:
-                    continue
+        by_id: dict[str, int] = {}
+        by_widget: dict[int, int] = {}
+        for i, zone in enumerate(zones):
+            if isinstance(zone, str):
+                by_id.setdefault(zone.lstrip("#"), i)
             else:
-                widget = zone_id
-            if widget is focused or focused in widget.walk_children():
-                return i
+                by_widget.setdefault(id(zone), i)
+        node: DOMNode | None = self.focused
+        while node is not None:
+            if node.id is not None and node.id in by_id:
+                return by_id[node.id]
+            if id(node) in by_widget:
+                return by_widget[id(node)]
+            node = node.parent
         return -1
 
     def _focus_zone(self, zone_id: str) -> None:
         if zone_id == "#task-filter-bar":
-            self.query_one("#task-filter-bar", TaskFilterBar).focus_text()
+            self._task_filter_bar.focus_text()
             self._focus_left_pane = False
         elif zone_id == "#queue-filter-bar":
-            self.query_one("#queue-filter-bar", QueueFilterBar).focus_text()
+            self._queue_filter_bar.focus_text()
             self._focus_left_pane = False
         elif zone_id == "#course-list":
-            self.query_one("#course-list", OptionList).focus()
+            self._course_list.focus()
             self._focus_left_pane = True
         elif zone_id == "#task-table":
-            self.query_one("#task-table", DataTable).focus()
+            self._task_table.focus()
             self._focus_left_pane = False
         elif zone_id == "#queue-table":
-            self.query_one("#queue-table", DataTable).focus()
+            self._queue_table.focus()
             self._focus_left_pane = False
         elif zone_id == "#gradebook-table":
-            self.query_one("#gradebook-table", DataTable).focus()
+            self._gradebook_table.focus()
             self._focus_left_pane = False
         elif zone_id == "#gb-filter-bar":
-            self.query_one("#gb-filter-bar", GradebookFilterBar).focus_text()
+            self._gb_filter_bar.focus_text()
             self._focus_left_pane = False
         elif zone_id == "#format-set":
-            self.query_one("#format-set", RadioSet).focus()
+            self._format_set.focus()
             self._focus_left_pane = False
         elif zone_id == "#output-dir-input":
-            self.query_one("#output-dir-input", Input).focus()
+            self._output_dir_input.focus()
             self._focus_left_pane = False
 
     def action_focus_left(self) -> None:
         self._focus_left_pane = True
-        self.query_one("#course-list", OptionList).focus()
+        self._course_list.focus()
 
     def action_focus_right(self) -> None:
         self._focus_left_pane = False
         self.action_focus_table()
 
     def action_focus_filter(self) -> None:
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        active = tabs.active
+        active = self._active_tab()
         if active == "export-tab":
             self._export_focus_prev()
             return
         if active == "tasks-tab":
-            self.query_one("#task-filter-bar", TaskFilterBar).focus_text()
+            self._task_filter_bar.focus_text()
         elif active == "queue-tab":
-            self.query_one("#queue-filter-bar", QueueFilterBar).focus_text()
+            self._queue_filter_bar.focus_text()
         elif active == "gradebook-tab":
-            self.query_one("#gb-filter-bar", GradebookFilterBar).focus_text()
+            self._gb_filter_bar.focus_text()
 
     def action_focus_table(self) -> None:
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        active = tabs.active
+        active = self._active_tab()
         if active == "export-tab":
             self._export_focus_next()
             return
         if active == "tasks-tab":
-            self.query_one("#task-table", DataTable).focus()
+            self._task_table.focus()
         elif active == "queue-tab":
-            self.query_one("#queue-table", DataTable).focus()
+            self._queue_table.focus()
         elif active == "gradebook-tab":
-            self.query_one("#gradebook-table", DataTable).focus()
+            self._gradebook_table.focus()
 
     _EXPORT_FOCUS_ORDER = [
         "#export-type-set",
@@ -680,79 +924,70 @@ class MainScreen(Screen[None]):
     def action_filter_next(self) -> None:
         if isinstance(self.focused, Input):
             return
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        active = tabs.active
+        active = self._active_tab()
         if active == "tasks-tab":
-            self.query_one("#task-filter-bar", TaskFilterBar).focus_next_filter()
+            self._task_filter_bar.focus_next_filter()
         elif active == "queue-tab":
-            self.query_one("#queue-filter-bar", QueueFilterBar).focus_next_filter()
+            self._queue_filter_bar.focus_next_filter()
         elif active == "gradebook-tab":
-            self.query_one("#gb-filter-bar", GradebookFilterBar).focus_next_filter()
+            self._gb_filter_bar.focus_next_filter()
 
     def action_filter_prev(self) -> None:
         if isinstance(self.focused, Input):
             return
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        active = tabs.active
+        active = self._active_tab()
         if active == "tasks-tab":
-            self.query_one("#task-filter-bar", TaskFilterBar).focus_prev_filter()
+            self._task_filter_bar.focus_prev_filter()
         elif active == "queue-tab":
-            self.query_one("#queue-filter-bar", QueueFilterBar).focus_prev_filter()
+            self._queue_filter_bar.focus_prev_filter()
         elif active == "gradebook-tab":
-            self.query_one("#gb-filter-bar", GradebookFilterBar).focus_prev_filter()
+            self._gb_filter_bar.focus_prev_filter()
 
-    def on_key(self, event: object) -> None:
-        from textual.events import Key
-
-        if not isinstance(event, Key):
+    def on_key(self, event: Key) -> None:
+        key = event.key
+        if key != "j" and key != "k":
             return
-
         focused = self.focused
-        if focused is None:
+        if not isinstance(focused, _VIM_NAV_WIDGETS):
             return
-
-        if isinstance(focused, (OptionList, DataTable)):
-            if event.key == "j":
-                event.prevent_default()
-                focused.action_cursor_down()
-            elif event.key == "k":
-                event.prevent_default()
-                focused.action_cursor_up()
+        event.prevent_default()
+        if key == "j":
+            focused.action_cursor_down()
+        else:
+            focused.action_cursor_up()
 
     def action_reset_filters(self) -> None:
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        active = tabs.active
+        active = self._active_tab()
         if active == "tasks-tab":
-            task_bar = self.query_one("#task-filter-bar", TaskFilterBar)
+            task_bar = self._task_filter_bar
             self._task_filter_undo = task_bar.save_state()
             task_bar.reset()
             self._show_status("Filters reset (u to undo)", kind="info", timeout=3)
         elif active == "queue-tab":
-            queue_bar = self.query_one("#queue-filter-bar", QueueFilterBar)
+            queue_bar = self._queue_filter_bar
             self._queue_filter_undo = queue_bar.save_state()
             queue_bar.reset()
             self._show_status("Filters reset (u to undo)", kind="info", timeout=3)
         elif active == "gradebook-tab":
-            gb_bar = self.query_one("#gb-filter-bar", GradebookFilterBar)
+            gb_bar = self._gb_filter_bar
             self._gb_filter_undo = gb_bar.save_state()
             gb_bar.reset()
             self._show_status("Filters reset (u to undo)", kind="info", timeout=3)
 
     def action_undo_filters(self) -> None:
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        active = tabs.active
+        active = self._active_tab()
         if active == "tasks-tab" and self._task_filter_undo is not None:
-            task_bar = self.query_one("#task-filter-bar", TaskFilterBar)
+            task_bar = self._task_filter_bar
             task_bar.restore_state(self._task_filter_undo)
             self._task_filter_undo = None
             self._show_status("Filters restored", kind="success", timeout=3)
         elif active == "queue-tab" and self._queue_filter_undo is not None:
-            queue_bar = self.query_one("#queue-filter-bar", QueueFilterBar)
+            queue_bar = self._queue_filter_bar
             queue_bar.restore_state(self._queue_filter_undo)
             self._queue_filter_undo = None
             self._show_status("Filters restored", kind="success", timeout=3)
         elif active == "gradebook-tab" and self._gb_filter_undo is not None:
-            gb_bar = self.query_one("#gb-filter-bar", GradebookFilterBar)
+            gb_bar = self._gb_filter_bar
             gb_bar.restore_state(self._gb_filter_undo)
             self._gb_filter_undo = None
             self._show_status("Filters restored", kind="success", timeout=3)
@@ -760,19 +995,19 @@ class MainScreen(Screen[None]):
             self._show_status("Nothing to undo", kind="warning", timeout=2)
 
     def action_add_course(self) -> None:
-        bar = self.query_one("#course-add-bar")
+        bar = self._course_add_bar
         if "visible" in bar.classes:
             bar.remove_class("visible")
-            self.query_one("#course-list", OptionList).focus()
+            self._course_list.focus()
         else:
             bar.add_class("visible")
-            inp = self.query_one("#course-id-input", Input)
+            inp = self._course_id_input
             inp.value = ""
             inp.focus()
 
     @on(Input.Submitted, "#course-id-input")
     def _submit_course_id(self) -> None:
-        inp = self.query_one("#course-id-input", Input)
+        inp = self._course_id_input
         try:
             course_id = int(inp.value.strip())
         except ValueError:
@@ -784,7 +1019,7 @@ class MainScreen(Screen[None]):
             return
 
         inp.value = ""
-        self.query_one("#course-add-bar").remove_class("visible")
+        self._course_add_bar.remove_class("visible")
         self._show_status(f"Loading course {course_id}...")
         self._fetch_course(course_id)
 
@@ -795,32 +1030,30 @@ class MainScreen(Screen[None]):
         cid = self._selected_course_id
         self.app.remove_course_id(cid)  # type: ignore[attr-defined]
 
-        option_list = self.query_one("#course-list", OptionList)
-        option_list.clear_options()
-        for course in self.app.courses.values():  # type: ignore[attr-defined]
-            title = course.title or f"Course {course.course_id}"
-            option_list.add_option(Option(title, id=str(course.course_id)))
-
-        self._selected_course_id = None
-        self.all_tasks = []
-        self.filtered_tasks = []
-        self._rebuild_task_table()
-        self._clear_detail()
-        self.all_queue_entries = []
-        self.filtered_queue_entries = []
-        self._rebuild_queue_table()
-        self._clear_queue_detail()
-        self._queue_loaded_for = None
-        self.query_one("#queue-info-label", Label).update("Select a teacher course to view queue")
-        self._show_status(f"Removed course {cid}", kind="success")
+        with self.app.batch_update():
+            with suppress(OptionDoesNotExist):
+                self._course_list.remove_option(str(cid))
+
+            self._selected_course_id = None
+            self.all_tasks = []
+            self.filtered_tasks = []
+            self._rebuild_task_table()
+            self._clear_detail()
+            self.all_queue_entries = []
+            self.filtered_queue_entries = []
+            self._rebuild_queue_table()
+            self._clear_queue_detail()
+            self._queue_loaded_for = None
+            self._queue_info_label.update("Select a teacher course to view queue")
+            self._show_status(f"Removed course {cid}", kind="success")
 
     def action_dismiss_overlay(self) -> None:
-        add_bar = self.query_one("#course-add-bar")
+        add_bar = self._course_add_bar
         if "visible" in add_bar.classes:
             add_bar.remove_class("visible")
-            self.query_one("#course-list", OptionList).focus()
+            self._course_list.focus()
             return
-        help_panel = self.query_one("#help-panel", Static)
+        help_panel = self._help_panel
         if self._help_visible:
             self._help_visible = False
             help_panel.update("")
@@ -850,191 +1083,347 @@ class MainScreen(Screen[None]):
         if course is None:
             return
 
-        self._selected_course_id = course_id
-        self.app.current_course = course  # type: ignore[attr-defined]
-        self.all_tasks = list(course.tasks)
-        self.is_teacher_view = any(t.section for t in self.all_tasks)
+        with self.app.batch_update():
+            self._selected_course_id = course_id
+            self.app.current_course = course  # type: ignore[attr-defined]
+            self.all_tasks = list(course.tasks)
+            self.is_teacher_view = any(t.section for t in self.all_tasks)
 
-        self.filtered_tasks = list(self.all_tasks)
-        self._update_task_filter_options()
-        self._setup_task_table_columns()
-        self._rebuild_task_table()
-        self._clear_detail()
-
-        self._queue_loaded_for = None
-        self.all_queue_entries = []
-        self.filtered_queue_entries = []
-        self._rebuild_queue_table()
-        self._clear_queue_detail()
+            self.filtered_tasks = list(self.all_tasks)
+            self._update_task_filter_options()
+            self._setup_task_table_columns()
+            self._rebuild_task_table()
+            self._clear_detail()
 
-        self._gradebook_loaded_for = None
-        self.all_gradebook_groups = []
-        self.filtered_gradebook_groups = []
-        self._gb_sort_column = None
-        self._gb_sort_reverse = False
-        self._gb_all_tasks = []
-        self.query_one("#gb-filter-bar", GradebookFilterBar).reset()
-        self._rebuild_gradebook_table([])
-        self.query_one("#gradebook-info-label", Label).update("Select a course to view gradebook")
+            self._queue_loaded_for = None
+            self.all_queue_entries = []
+            self.filtered_queue_entries = []
+            self._rebuild_queue_table()
+            self._clear_queue_detail()
 
-        self._set_export_status("")
+            self._gradebook_loaded_for = None
+            self.all_gradebook_groups = []
+            self.filtered_gradebook_groups = []
+            self._gb_sort_column = None
+            self._gb_sort_reverse = False
+            self._gb_all_tasks = []
+            self._gb_filter_bar.reset()
+            self._rebuild_gradebook_table([])
+            self._gradebook_info_label.update("Select a course to view gradebook")
 
-        try:
-            queue_export_radio = self.query_one("#queue-export-radio", RadioButton)
-            subs_export_radio = self.query_one("#subs-export-radio", RadioButton)
-            queue_export_radio.disabled = not self.is_teacher_view
-            subs_export_radio.disabled = not self.is_teacher_view
-        except Exception:
-            logger.debug("Failed to update export radio buttons", exc_info=True)
+            self._set_export_status("")
 
-        if self.is_teacher_view:
-            self.query_one("#queue-info-label", Label).update("Queue loads on demand")
-        else:
-            self.query_one("#queue-info-label", Label).update(
-                "Queue available for teacher courses only"
-            )
+            try:
+                queue_export_radio = self.query_one("#queue-export-radio", RadioButton)
+                subs_export_radio = self.query_one("#subs-export-radio", RadioButton)
+                queue_export_radio.disabled = not self.is_teacher_view
+                subs_export_radio.disabled = not self.is_teacher_view
+            except Exception:
+                logger.debug("Failed to update export radio buttons", exc_info=True)
 
-        current_export_type = self._get_current_export_type()
-        if current_export_type == "tasks-export-radio":
-            self._update_export_filters()
-            self._update_params()
-            self._refresh_export_preview()
-        else:
-            self._set_export_filters_loading_state()
-            self._update_params()
-            self._refresh_export_preview()
+            if self.is_teacher_view:
+                self._queue_info_label.update("Queue loads on demand")
+            else:
+                self._queue_info_label.update("Queue available for teacher courses only")
 
-        tabs = self.query_one("#main-tabs", TabbedContent)
-        if tabs.active == "queue-tab":
-            self._maybe_load_queue()
-        elif tabs.active == "gradebook-tab":
-            self._maybe_load_gradebook()
-        elif tabs.active == "export-tab":
-            self._start_export_preload(current_export_type)
+            self._export_filters_dirty = True
+            active = self._active_tab()
+            if active == "queue-tab":
+                self._maybe_load_queue()
+            elif active == "gradebook-tab":
+                self._maybe_load_gradebook()
+            elif active == "export-tab":
+                self._sync_export_tab()
+
+    def _task_row_cells(self) -> dict[int, tuple[Text | str, ...]]:
+        """Deadline-independent task row cells by task id, reset when all_tasks is replaced."""
+        if self._task_cells_source is not self.all_tasks:
+            self._task_cells = {}
+            self._task_cells_source = self.all_tasks
+        return self._task_cells
+
+    def _task_titles_lc(self) -> list[str]:
+        """Lowercased task titles, rebuilt only when all_tasks is replaced."""
+        if self._task_lc_source is not self.all_tasks:
+            self._task_title_lc = [t.title.lower() for t in self.all_tasks]
+            self._task_lc_source = self.all_tasks
+        return self._task_title_lc
+
+    def _queue_fields_lc(self) -> tuple[list[str], list[str]]:
+        """Lowercased queue student names and task titles, cached per entry list."""
+        if self._queue_lc_source is not self.all_queue_entries:
+            entries = self.all_queue_entries
+            self._queue_student_lc = [e.student_name.lower() for e in entries]
+            self._queue_task_lc = [e.task_title.lower() for e in entries]
+            self._queue_lc_source = entries
+        return self._queue_student_lc, self._queue_task_lc
+
+    def _gb_students_lc(self) -> list[list[str]]:
+        """Lowercased student names per gradebook group, cached per group list."""
+        if self._gb_lc_source is not self.all_gradebook_groups:
+            self._gb_student_lc = [
+                [e.student_name.lower() for e in g.entries] for g in self.all_gradebook_groups
+            ]
+            self._gb_lc_source = self.all_gradebook_groups
+        return self._gb_student_lc
+
+    def _queue_entry_for_url(self, issue_url: str) -> QueueEntry | None:
+        """Look up a queue entry by issue URL, indexing all_queue_entries on first use."""
+        if self._queue_index_source is not self.all_queue_entries:
+            self._queue_by_url = {
+                e.issue_url: e for e in reversed(self.all_queue_entries) if e.issue_url
+            }
+            self._queue_index_source = self.all_queue_entries
+        return self._queue_by_url.get(issue_url)
+
+    def _queue_sort_keys_for(self, col: int, key_fn: Callable[[QueueEntry], Any]) -> dict[int, Any]:
+        """Sort keys for a queue column by entry id, cached per entry list."""
+        if self._queue_sort_source is not self.all_queue_entries:
+            self._queue_sort_keys = {}
+            self._queue_sort_source = self.all_queue_entries
+        keys = self._queue_sort_keys.get(col)
+        if keys is None:
+            keys = {id(e): key_fn(e) for e in self.all_queue_entries}
+            self._queue_sort_keys[col] = keys
+        return keys
+
+    def _task_filter_options(self) -> tuple[list[str], ...]:
+        """Sorted distinct task titles, statuses and sections, cached per task list."""
+        if self._task_options_source is not self.all_tasks:
+            titles: set[str] = set()
+            statuses: set[str] = set()
+            sections: set[str] = set()
+            for t in self.all_tasks:
+                titles.add(t.title)
+                statuses.add(t.status)
+                sections.add(t.section)
+            for values in (titles, statuses, sections):
+                values.discard("")
+            self._task_options = tuple(sorted(values) for values in (titles, statuses, sections))
+            self._task_options_source = self.all_tasks
+        return self._task_options
+
+    def _queue_filter_options(self) -> tuple[list[str], ...]:
+        """Sorted distinct queue students, tasks, statuses and reviewers, cached per entry list."""
+        if self._queue_options_source is not self.all_queue_entries:
+            self._queue_options = _queue_option_lists(self.all_queue_entries)
+            self._queue_options_source = self.all_queue_entries
+        return self._queue_options
+
+    def _gb_filter_options(self) -> tuple[list[str], ...]:
+        """Sorted distinct gradebook groups and teachers, cached per group list."""
+        if self._gb_options_source is not self.all_gradebook_groups:
+            groups: set[str] = set()
+            teachers: set[str] = set()
+            for g in self.all_gradebook_groups:
+                groups.add(g.group_name)
+                teachers.add(g.teacher_name)
+            for values in (groups, teachers):
+                values.discard("")
+            self._gb_options = (sorted(groups), sorted(teachers))
+            self._gb_options_source = self.all_gradebook_groups
+        return self._gb_options
 
     @on(TaskFilterBar.Changed)
     def _handle_task_filter(self, event: TaskFilterBar.Changed) -> None:
+        """Apply select changes at once; debounce bursts of text edits."""
+        last = self._task_filter
+        self._task_filter = event
+        if self._task_filter_timer is not None:
+            self._task_filter_timer.stop()
+            self._task_filter_timer = None
+        if last is not None and (last.status, last.section) == (event.status, event.section):
+            self._task_filter_timer = self.set_timer(_FILTER_DEBOUNCE, self._apply_task_filter)
+        else:
+            self._apply_task_filter()
+
+    def _apply_task_filter(self) -> None:
+        self._task_filter_timer = None
+        event = self._task_filter
+        if event is None:
+            return
+        tasks = self.all_tasks
+        titles_lc = self._task_titles_lc()
         needle = event.text.lower()
-        self.filtered_tasks = [
-            t
-            for t in self.all_tasks
-            if (not needle or needle in t.title.lower())
-            and (not event.status or t.status == event.status)
-            and (not event.section or t.section == event.section)
+        state = (needle, event.status, event.section)
+        last = self._task_filter_state
+        same_source = self._task_match_source is tasks
+        if same_source and state == last:
+            return
+        candidates: Sequence[int]
+        if (
+            last is not None
+            and same_source
+            and last[1:] == state[1:]
+            and needle.startswith(last[0])
+        ):
+            # A longer needle can only narrow the previous matches.
+            candidates = self._task_matches
+        else:
+            candidates = range(len(tasks))
+        status, section = event.status, event.section
+        matches = [
+            i
+            for i in candidates
+            if (not status or tasks[i].status == status)
+            and (not section or tasks[i].section == section)
+            and (not needle or needle in titles_lc[i])
         ]
+        self._task_filter_state = state
+        self._task_match_source = tasks
+        self._task_matches = matches
+        self.filtered_tasks = [tasks[i] for i in matches]
         self._rebuild_task_table()
 
     def _update_task_filter_options(self) -> None:
-        statuses = sorted({t.status for t in self.all_tasks if t.status})
-        sections = sorted({t.section for t in self.all_tasks if t.section})
-        self.query_one("#task-filter-bar", TaskFilterBar).update_options(statuses, sections)
+        _, statuses, sections = self._task_filter_options()
+        self._task_filter_bar.update_options(statuses, sections)
 
     @on(DataTable.RowHighlighted, "#task-table")
     def _task_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
-        if event.row_key.value is None:
-            return
-        try:
-            idx = int(event.row_key.value) - 1
-        except (ValueError, TypeError):
-            return
-        if 0 <= idx < len(self.filtered_tasks):
-            self._show_detail(self.filtered_tasks[idx])
+        task = self._task_by_key.get(event.row_key)
+        if task is not None:
+            self._show_detail(task)
 
     @on(DataTable.RowSelected, "#task-table")
     def _task_row_selected(self, event: DataTable.RowSelected) -> None:
-        if event.row_key.value is None:
-            return
-        try:
-            idx = int(event.row_key.value) - 1
-        except (ValueError, TypeError):
-            return
-        if 0 <= idx < len(self.filtered_tasks):
-            self._show_detail(self.filtered_tasks[idx])
+        task = self._task_by_key.get(event.row_key)
+        if task is not None:
+            self._show_detail(task)
 
     @on(QueueFilterBar.Changed)
     def _handle_queue_filter(self, event: QueueFilterBar.Changed) -> None:
+        """Apply select changes at once; debounce bursts of text edits."""
+        last = self._queue_filter
+        self._queue_filter = event
+        if self._queue_filter_timer is not None:
+            self._queue_filter_timer.stop()
+            self._queue_filter_timer = None
+        selects = (event.student, event.task, event.status, event.reviewer)
+        if last is not None and selects == (last.student, last.task, last.status, last.reviewer):
+            self._queue_filter_timer = self.set_timer(_FILTER_DEBOUNCE, self._apply_queue_filter)
+        else:
+            self._apply_queue_filter()
+
+    def _apply_queue_filter(self) -> None:
+        self._queue_filter_timer = None
+        event = self._queue_filter
+        if event is None:
+            return
+        entries = self.all_queue_entries
+        students_lc, tasks_lc = self._queue_fields_lc()
         needle = event.text.lower()
-        self.filtered_queue_entries = [
-            e
-            for e in self.all_queue_entries
-            if (not needle or needle in e.student_name.lower() or needle in e.task_title.lower())
-            and (not event.student or e.student_name == event.student)
-            and (not event.task or e.task_title == event.task)
-            and (not event.status or e.status_name == event.status)
-            and (not event.reviewer or e.responsible_name == event.reviewer)
+        state = (needle, event.student, event.task, event.status, event.reviewer)
+        last = self._queue_filter_state
+        same_source = self._queue_match_source is entries
+        if same_source and state == last:
+            return
+        candidates: Sequence[int]
+        if (
+            last is not None
+            and same_source
+            and last[1:] == state[1:]
+            and needle.startswith(last[0])
+        ):
+            # A longer needle can only narrow the previous matches.
+            candidates = self._queue_matches
+        else:
+            candidates = range(len(entries))
+        student, task, status, reviewer = event.student, event.task, event.status, event.reviewer
+        matches = [
+            i
+            for i in candidates
+            if (not student or entries[i].student_name == student)
+            and (not task or entries[i].task_title == task)
+            and (not status or entries[i].status_name == status)
+            and (not reviewer or entries[i].responsible_name == reviewer)
+            and (not needle or needle in students_lc[i] or needle in tasks_lc[i])
         ]
+        self._queue_filter_state = state
+        self._queue_match_source = entries
+        self._queue_matches = matches
+        self.filtered_queue_entries = [entries[i] for i in matches]
         self._rebuild_queue_table()
 
     def _update_queue_filter_options(self) -> None:
-        students = sorted({e.student_name for e in self.all_queue_entries if e.student_name})
-        tasks = sorted({e.task_title for e in self.all_queue_entries if e.task_title})
-        statuses = sorted({e.status_name for e in self.all_queue_entries if e.status_name})
-        reviewers = sorted(
-            {e.responsible_name for e in self.all_queue_entries if e.responsible_name}
-        )
-        self.query_one("#queue-filter-bar", QueueFilterBar).update_options(
-            students, tasks, statuses, reviewers
-        )
+        self._export_filters_dirty = True
+        self._queue_filter_bar.update_options(*self._queue_filter_options())
 
     @on(DataTable.RowHighlighted, "#queue-table")
     def _queue_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         if event.row_key.value is None:
             return
-        issue_url = event.row_key.value
-        entry = next(
-            (e for e in self.all_queue_entries if e.issue_url == issue_url),
-            None,
-        )
+        entry = self._queue_entry_for_url(event.row_key.value)
         if entry and entry.has_issue_access and entry.issue_url:
             self._load_queue_preview(entry)
         elif entry:
             self._show_queue_preview_info(entry)
+        self._schedule_queue_prefetch(event.cursor_row)
+
+    def _schedule_queue_prefetch(self, row: int) -> None:
+        """Prefetch submissions around ``row`` once the cursor settles."""
+        if self._queue_prefetch_timer is not None:
+            self._queue_prefetch_timer.stop()
+        entries = self.filtered_queue_entries
+        lo = max(row - _PREFETCH_RADIUS, 0)
+        hi = row + _PREFETCH_RADIUS + 1
+        neighbours = entries[row + 1 : hi] + entries[lo:row][::-1]
+        self._queue_prefetch_timer = self.set_timer(
+            _PREFETCH_DELAY, lambda: self._prefetch_submissions(neighbours)
+        )
+
+    @work(thread=True, exclusive=True, group="queue-prefetch")
+    def _prefetch_submissions(self, entries: list[QueueEntry]) -> None:
+        """Fetch and cache submissions for queue entries not cached yet."""
+        client = self.app.client  # type: ignore[attr-defined]
+        if not client or self._selected_course_id is None:
+            return
+        cache = self.app.queue_cache.get(  # type: ignore[attr-defined]
+            self._selected_course_id
+        )
+        if cache is None:
+            return
+        worker = get_current_worker()
+        for entry in entries:
+            if worker.is_cancelled:
+                return
+            url = entry.issue_url
+            if not entry.has_issue_access or not url or url in cache.submissions:
+                continue
+            try:
+                self._fetch_submission(client, url)
+            except Exception:
+                logger.debug("Failed to prefetch %s", url, exc_info=True)
 
     @on(DataTable.RowSelected, "#queue-table")
     def _queue_row_selected(self, event: DataTable.RowSelected) -> None:
         if event.row_key.value is None:
             return
-        issue_url = event.row_key.value
-        entry = next(
-            (e for e in self.all_queue_entries if e.issue_url == issue_url),
-            None,
-        )
+        entry = self._queue_entry_for_url(event.row_key.value)
         if entry and entry.has_issue_access and entry.issue_url:
             self._fetch_and_show_submission(entry)
 
     def _show_queue_preview_info(self, entry: QueueEntry) -> None:
         """Show basic queue entry info when no issue access."""
-        scroll = self.query_one("#queue-detail-scroll", VerticalScroll)
-        scroll.remove_children()
-        scroll.mount(
-            Label(
-                f"[bold]{entry.task_title}[/bold]",
-                classes="detail-heading",
-            )
-        )
-        scroll.mount(Label(f"Student: {entry.student_name}", classes="detail-text"))
-        scroll.mount(Label(f"Status: {entry.status_name}", classes="detail-text"))
-        scroll.mount(
-            Label(
-                f"Reviewer: {entry.responsible_name or '-'}",
-                classes="detail-text",
-            )
+        self._set_queue_detail(
+            [
+                f"[bold]{escape(entry.task_title)}[/bold]",
+                f"Student: {escape(entry.student_name)}",
+                f"Status: {escape(entry.status_name)}",
+                f"Reviewer: {escape(entry.responsible_name or '-')}",
+                f"Updated: {escape(entry.update_time)}",
+                f"Grade: {escape(entry.mark or '-')}",
+            ]
         )
-        scroll.mount(Label(f"Updated: {entry.update_time}", classes="detail-text"))
-        scroll.mount(Label(f"Grade: {entry.mark or '-'}", classes="detail-text"))
 
-    @work(thread=True)
+    @work(thread=True, exclusive=True, group="queue-preview")
     def _load_queue_preview(self, entry: QueueEntry) -> None:
         """Auto-load submission preview for queue detail pane."""
         try:
-            if self._selected_course_id is not None:
-                cache = self.app.queue_cache.get(  # type: ignore[attr-defined]
-                    self._selected_course_id
-                )
-                if cache and entry.issue_url in cache.submissions:
-                    sub = cache.submissions[entry.issue_url]
-                    self.app.call_from_thread(self._render_queue_preview, sub)
-                    return
+            cached = self._cached_submission(entry.issue_url)
+            if cached is not None:
+                self.app.call_from_thread(self._render_queue_preview, cached)
+                return
 
             client = self.app.client  # type: ignore[attr-defined]
             if not client:
@@ -1042,104 +1431,78 @@ class MainScreen(Screen[None]):
 
             self.app.call_from_thread(self._show_queue_preview_loading, entry)
 
-            html = client.fetch_submission_page(entry.issue_url)
-            issue_id = extract_issue_id_from_breadcrumb(html)
-            if issue_id == 0:
+            sub = self._fetch_submission(client, entry.issue_url)
+            if get_current_worker().is_cancelled:
+                return
+            if sub is None:
                 self.app.call_from_thread(self._show_queue_preview_info, entry)
                 return
 
-            sub = parse_submission_page(html, issue_id)
-
-            if self._selected_course_id is not None:
-                cache = self.app.queue_cache.get(  # type: ignore[attr-defined]
-                    self._selected_course_id
-                )
-                if cache:
-                    cache.submissions[entry.issue_url] = sub
-
             self.app.call_from_thread(self._render_queue_preview, sub)
         except Exception:
             logger.debug("Failed to load queue preview", exc_info=True)
             self.app.call_from_thread(self._show_queue_preview_info, entry)
 
     def _show_queue_preview_loading(self, entry: QueueEntry) -> None:
-        scroll = self.query_one("#queue-detail-scroll", VerticalScroll)
-        scroll.remove_children()
-        scroll.mount(
-            Label(
-                f"[bold]{entry.task_title}[/bold]",
-                classes="detail-heading",
-            )
+        self._set_queue_detail(
+            [
+                f"[bold]{escape(entry.task_title)}[/bold]",
+                f"Student: {escape(entry.student_name)}",
+                "[dim]Loading...[/dim]",
+            ]
         )
-        scroll.mount(Label(f"Student: {entry.student_name}", classes="detail-text"))
-        scroll.mount(Label("[dim]Loading...[/dim]", classes="detail-text"))
 
-    def _render_queue_preview(self, sub: Submission) -> None:
-        """Render submission preview in the queue detail pane."""
-        scroll = self.query_one("#queue-detail-scroll", VerticalScroll)
+    def _set_queue_detail(self, parts: list[str]) -> None:
+        """Replace the queue detail pane with a single markup block."""
+        self._queue_detail_sub = None
+        scroll = self._queue_detail_scroll
         scroll.remove_children()
+        scroll.mount(Static("\n".join(parts), classes="detail-text"))
 
-        scroll.mount(Label(f"[bold]{sub.task_title}[/bold]", classes="detail-heading"))
-        scroll.mount(Label(f"Student: {sub.student_name}", classes="detail-text"))
-        scroll.mount(
-            Label(
-                f"Reviewer: {sub.reviewer_name or '-'}",
-                classes="detail-text",
-            )
-        )
-        scroll.mount(
-            Label(
-                f"Status: {sub.status}  |  Grade: {sub.grade}/{sub.max_score}",
-                classes="detail-text",
-            )
-        )
+    def _render_queue_preview(self, sub: Submission) -> None:
+        """Render submission preview in the queue detail pane."""
+        if sub is self._queue_detail_sub:
+            return
+        parts = [
+            f"[bold]{escape(sub.task_title)}[/bold]",
+            f"Student: {escape(sub.student_name)}",
+            f"Reviewer: {escape(sub.reviewer_name or '-')}",
+            f"Status: {escape(sub.status)}  |  Grade: {escape(f'{sub.grade}/{sub.max_score}')}",
+        ]
         if sub.deadline:
-            scroll.mount(Label(f"Deadline: {sub.deadline}", classes="detail-text"))
+            parts.append(f"Deadline: {escape(sub.deadline)}")
 
         if sub.comments:
-            scroll.mount(
-                Label(
-                    f"\n[bold]Comments ({len(sub.comments)})[/bold]",
-                    classes="detail-heading",
-                )
-            )
+            parts.append(f"\n[bold]Comments ({len(sub.comments)})[/bold]")
             for comment in sub.comments:
-                ts = comment.timestamp.strftime("%d.%m.%Y %H:%M") if comment.timestamp else "-"
+                ts = _format_timestamp(comment.timestamp) if comment.timestamp else "-"
                 after = " [bold red](LATE)[/bold red]" if comment.is_after_deadline else ""
-                scroll.mount(
-                    Label(
-                        f"[bold]{comment.author_name}[/bold] [dim]{ts}[/dim]{after}",
-                        classes="detail-text",
-                    )
+                parts.append(
+                    f"[bold]{escape(comment.author_name)}[/bold] [dim]{escape(ts)}[/dim]{after}"
                 )
                 if comment.content_html:
                     text = strip_html(comment.content_html)
                     if text:
-                        scroll.mount(Label(text, classes="detail-text"))
+                        parts.append(escape(text))
                 if comment.files:
-                    fnames = ", ".join(f.filename for f in comment.files)
-                    scroll.mount(
-                        Label(
-                            f"[dim]Files: {fnames}[/dim]",
-                            classes="detail-text",
-                        )
-                    )
+                    fnames = escape(", ".join(f.filename for f in comment.files))
+                    parts.append(f"[dim]Files: {fnames}[/dim]")
 
-        scroll.mount(
-            Label(
-                "\n[dim]Press Enter for full view[/dim]",
-                classes="detail-text",
-            )
-        )
+        parts.append("\n[dim]Press Enter for full view[/dim]")
+        self._set_queue_detail(parts)
+        self._queue_detail_sub = sub
 
     def _clear_queue_detail(self) -> None:
-        scroll = self.query_one("#queue-detail-scroll", VerticalScroll)
+        self._queue_detail_sub = None
+        scroll = self._queue_detail_scroll
         scroll.remove_children()
         scroll.mount(Label("[dim]Select a queue entry[/dim]"))
 
     @on(DataTable.HeaderSelected, "#queue-table")
     def _queue_header_selected(self, event: DataTable.HeaderSelected) -> None:
         col_idx = event.column_index
+        if col_idx not in _QUEUE_SORT_KEYS:
+            return  # # column, not sortable
         if self._queue_sort_column == col_idx:
             self._queue_sort_reverse = not self._queue_sort_reverse
         else:
@@ -1151,18 +1514,12 @@ class MainScreen(Screen[None]):
         col = self._queue_sort_column
         if col is None:
             return
-        key_map: dict[int, Any] = {
-            0: lambda e: 0,
-            1: lambda e: e.student_name.lower(),
-            2: lambda e: e.task_title.lower(),
-            3: lambda e: e.status_name.lower(),
-            4: lambda e: e.responsible_name.lower(),
-            5: lambda e: _parse_update_time(e.update_time),
-            6: lambda e: _parse_mark(e.mark),
-        }
-        key_fn = key_map.get(col)
+        key_fn = _QUEUE_SORT_KEYS.get(col)
         if key_fn:
-            self.filtered_queue_entries.sort(key=key_fn, reverse=self._queue_sort_reverse)
+            keys = self._queue_sort_keys_for(col, key_fn)
+            self.filtered_queue_entries.sort(
+                key=lambda e: keys[id(e)], reverse=self._queue_sort_reverse
+            )
             self._rebuild_queue_table()
 
     @on(RadioSet.Changed, "#export-type-set")
@@ -1177,6 +1534,19 @@ class MainScreen(Screen[None]):
             self._refresh_export_preview()
             self._start_export_preload(export_type)
 
+    def _sync_export_tab(self) -> None:
+        """Bring export filters, columns and preview up to date with loaded data."""
+        export_type = self._get_current_export_type()
+        if self._has_loaded_export_data(export_type):
+            self._update_export_filters()
+            self._update_params()
+            self._refresh_export_preview()
+        else:
+            self._set_export_filters_loading_state()
+            self._update_params()
+            self._refresh_export_preview()
+            self._start_export_preload(export_type)
+
     @on(RadioSet.Changed, "#format-set")
     def _format_changed(self, event: RadioSet.Changed) -> None:
         self._refresh_export_preview()
@@ -1191,10 +1561,11 @@ class MainScreen(Screen[None]):
 
     def _update_export_filters(self) -> None:
         """Update row filter dropdowns based on current export type."""
+        self._export_filters_dirty = False
         try:
-            task_select = self.query_one("#export-filter-task", Select)
-            status_select = self.query_one("#export-filter-status", Select)
-            reviewer_select = self.query_one("#export-filter-reviewer", Select)
+            task_select = self._export_task_select
+            status_select = self._export_status_select
+            reviewer_select = self._export_reviewer_select
         except Exception:
             return
 
@@ -1228,9 +1599,7 @@ class MainScreen(Screen[None]):
             logger.debug("Failed to update files radio", exc_info=True)
 
         if export_type == "tasks-export-radio":
-            titles = sorted({t.title for t in self.all_tasks if t.title})
-            statuses = sorted({t.status for t in self.all_tasks if t.status})
-            sections = sorted({t.section for t in self.all_tasks if t.section})
+            titles, statuses, sections = self._task_filter_options()
             self._set_export_filter_options(
                 task_select,
                 [(t, t) for t in titles],
@@ -1245,11 +1614,7 @@ class MainScreen(Screen[None]):
             )
             self._set_export_filter_options(reviewer_select, [], Select.BLANK, enabled=False)
         elif export_type in ("queue-export-radio", "subs-export-radio"):
-            tasks = sorted({e.task_title for e in self.all_queue_entries if e.task_title})
-            statuses = sorted({e.status_name for e in self.all_queue_entries if e.status_name})
-            reviewers = sorted(
-                {e.responsible_name for e in self.all_queue_entries if e.responsible_name}
-            )
+            _, tasks, statuses, reviewers = self._queue_filter_options()
             self._set_export_filter_options(
                 task_select,
                 [(t, t) for t in tasks],
@@ -1269,8 +1634,7 @@ class MainScreen(Screen[None]):
                 enabled=bool(reviewers),
             )
         elif export_type == "gb-export-radio":
-            groups = sorted({g.group_name for g in self.all_gradebook_groups if g.group_name})
-            teachers = sorted({g.teacher_name for g in self.all_gradebook_groups if g.teacher_name})
+            groups, teachers = self._gb_filter_options()
             self._set_export_filter_options(
                 task_select,
                 [(g, g) for g in groups],
@@ -1303,9 +1667,9 @@ class MainScreen(Screen[None]):
             select.disabled = True
             select.value = Select.BLANK
             focused = self.focused
-            if focused is not None and (focused is select or focused in select.walk_children()):
+            if focused is not None and _is_within(select, focused):
                 with suppress(Exception):
-                    self.query_one("#export-type-set", RadioSet).focus()
+                    self._export_type_set.focus()
             return
         select.disabled = False
         values = {value for _, value in options}
@@ -1342,9 +1706,9 @@ class MainScreen(Screen[None]):
         filters: dict[str, str] = {}
         try:
             export_type = self._get_current_export_type()
-            task_val = self.query_one("#export-filter-task", Select).value
-            status_val = self.query_one("#export-filter-status", Select).value
-            reviewer_val = self.query_one("#export-filter-reviewer", Select).value
+            task_val = self._export_task_select.value
+            status_val = self._export_status_select.value
+            reviewer_val = self._export_reviewer_select.value
             if export_type == "tasks-export-radio":
                 if task_val is not Select.BLANK:
                     filters["task"] = str(task_val)
@@ -1369,7 +1733,7 @@ class MainScreen(Screen[None]):
     def _update_params(self) -> None:
         """Rebuild parameter list based on current export type and course data."""
         try:
-            selector = self.query_one("#param-selector", ParameterSelector)
+            selector = self._param_selector
         except Exception:
             return
 
@@ -1382,12 +1746,7 @@ class MainScreen(Screen[None]):
         elif export_type == "subs-export-radio":
             params = SUBMISSIONS_PARAMS
         elif export_type == "gb-export-radio":
-            all_tasks: list[str] = []
-            for g in self.all_gradebook_groups:
-                for t in g.task_titles:
-                    if t not in all_tasks:
-                        all_tasks.append(t)
-            params = gradebook_params(all_tasks)
+            params = gradebook_params(_gradebook_task_titles(self.all_gradebook_groups))
         else:
             params = []
 
@@ -1401,7 +1760,7 @@ class MainScreen(Screen[None]):
     def _get_included_columns(self) -> list[str]:
         """Get list of selected parameter names."""
         try:
-            selector = self.query_one("#param-selector", ParameterSelector)
+            selector = self._param_selector
             return selector.get_included()
         except Exception:
             return []
@@ -1412,7 +1771,7 @@ class MainScreen(Screen[None]):
             export_type = self._get_current_export_type()
             fmt = self._get_current_export_format()
             preview_text = self._generate_preview(export_type, fmt)
-            self.query_one("#export-preview-content", Static).update(preview_text)
+            self._export_preview.update(preview_text)
         except Exception:
             logger.debug("Failed to update export preview", exc_info=True)
 
@@ -1429,21 +1788,15 @@ class MainScreen(Screen[None]):
         token = self._export_preload_token
         if export_type == "queue-export-radio":
             self._set_export_status("Loading queue data...", "info")
-            self.query_one("#export-preview-content", Static).update(
-                "[dim]Loading queue data...[/dim]"
-            )
+            self._export_preview.update("[dim]Loading queue data...[/dim]")
             self._preload_export_data(export_type, course_id, token)
         elif export_type == "subs-export-radio":
             self._set_export_status("Loading submissions source data...", "info")
-            self.query_one("#export-preview-content", Static).update(
-                "[dim]Loading submissions source data...[/dim]"
-            )
+            self._export_preview.update("[dim]Loading submissions source data...[/dim]")
             self._preload_export_data(export_type, course_id, token)
         elif export_type == "gb-export-radio":
             self._set_export_status("Loading gradebook data...", "info")
-            self.query_one("#export-preview-content", Static).update(
-                "[dim]Loading gradebook data...[/dim]"
-            )
+            self._export_preview.update("[dim]Loading gradebook data...[/dim]")
             self._preload_export_data(export_type, course_id, token)
 
     @work(thread=True)
@@ -1504,21 +1857,15 @@ class MainScreen(Screen[None]):
 
     def _get_current_export_type(self) -> str:
         try:
-            btn = self.query_one("#export-type-set", RadioSet).pressed_button
+            btn = self._export_type_set.pressed_button
             return (btn.id or "tasks-export-radio") if btn else "tasks-export-radio"
         except Exception:
             return "tasks-export-radio"
 
     def _get_current_export_format(self) -> str:
         try:
-            btn = self.query_one("#format-set", RadioSet).pressed_button
-            fmt_map = {
-                "json-radio": "json",
-                "md-radio": "markdown",
-                "csv-radio": "csv",
-                "files-radio": "files",
-            }
-            return fmt_map.get(btn.id or "", "json") if btn else "json"
+            btn = self._format_set.pressed_button
+            return _EXPORT_FORMATS.get(btn.id or "", "json") if btn else "json"
         except Exception:
             return "json"
 
@@ -1547,16 +1894,11 @@ class MainScreen(Screen[None]):
             )
 
         elif export_type == "queue-export-radio":
-            q_entries = list(self.all_queue_entries)
-            if not q_entries:
+            source: Sequence[QueueEntry] = self.all_queue_entries
+            if not source:
                 cache = self.app.queue_cache  # type: ignore[attr-defined]
-                q_entries = list(cache.get(course_id, ReviewQueue(course_id=course_id)).entries)
-            if filters.get("task"):
-                q_entries = [e for e in q_entries if e.task_title == filters["task"]]
-            if filters.get("status"):
-                q_entries = [e for e in q_entries if e.status_name == filters["status"]]
-            if filters.get("reviewer"):
-                q_entries = [e for e in q_entries if e.responsible_name == filters["reviewer"]]
+                source = cache.get(course_id, ReviewQueue(course_id=course_id)).entries
+            q_entries = _filter_queue_entries(source, filters)
             if not q_entries:
                 return "[dim]Queue data will be loaded during export[/dim]"
             return self._preview_queue(
@@ -1582,16 +1924,11 @@ class MainScreen(Screen[None]):
         elif export_type == "subs-export-radio":
             if format_type == "files":
                 return "[dim]Files Only mode:\nDownloads submission files\nto student folders[/dim]"
-            sub_entries = list(self.all_queue_entries)
-            if not sub_entries:
+            source = self.all_queue_entries
+            if not source:
                 cache = self.app.queue_cache  # type: ignore[attr-defined]
-                sub_entries = list(cache.get(course_id, ReviewQueue(course_id=course_id)).entries)
-            if filters.get("task"):
-                sub_entries = [e for e in sub_entries if e.task_title == filters["task"]]
-            if filters.get("status"):
-                sub_entries = [e for e in sub_entries if e.status_name == filters["status"]]
-            if filters.get("reviewer"):
-                sub_entries = [e for e in sub_entries if e.responsible_name == filters["reviewer"]]
+                source = cache.get(course_id, ReviewQueue(course_id=course_id)).entries
+            sub_entries = _filter_queue_entries(source, filters)
             if not sub_entries:
                 return "[dim]Queue data will be loaded during export[/dim]"
             return self._preview_submissions(
@@ -1889,11 +2226,7 @@ class MainScreen(Screen[None]):
     ) -> str:
         import json as json_mod
 
-        all_tasks: list[str] = []
-        for g in groups:
-            for t in g.task_titles:
-                if t not in all_tasks:
-                    all_tasks.append(t)
+        all_tasks = _gradebook_task_titles(groups)
 
         if fmt == "json":
             items = []
@@ -1989,25 +2322,19 @@ class MainScreen(Screen[None]):
             self._set_export_status("Select a course first", "error")
             return
 
-        format_set = self.query_one("#format-set", RadioSet)
+        format_set = self._format_set
         fmt_btn = format_set.pressed_button
         if not fmt_btn:
             self._set_export_status("Select a format", "error")
             return
 
-        fmt_map = {
-            "json-radio": "json",
-            "md-radio": "markdown",
-            "csv-radio": "csv",
-            "files-radio": "files",
-        }
-        fmt = fmt_map.get(fmt_btn.id or "", "json")
+        fmt = _EXPORT_FORMATS.get(fmt_btn.id or "", "json")
 
-        type_set = self.query_one("#export-type-set", RadioSet)
+        type_set = self._export_type_set
         type_btn = type_set.pressed_button
         export_type = type_btn.id if type_btn else "tasks-export-radio"
 
-        output_dir = self.query_one("#output-dir-input", Input).value.strip() or "./output"
+        output_dir = self._output_dir_input.value.strip() or "./output"
         output_path = Path(output_dir).expanduser().resolve()
 
         filters = self._get_current_export_filters()
@@ -2015,10 +2342,11 @@ class MainScreen(Screen[None]):
         self._do_export(fmt, output_path, export_type or "tasks-export-radio", filters)
 
     def _set_export_status(self, message: str, kind: str = "info") -> None:
-        label = self.query_one("#export-status-label", Label)
+        label = self._export_status_label
         label.update(message)
-        label.remove_class("error", "success", "info")
-        label.add_class(kind)
+        if not label.has_class(kind):
+            label.remove_class("error", "success", "info")
+            label.add_class(kind)
 
     @work(thread=True)
     def _do_export(
@@ -2067,14 +2395,7 @@ class MainScreen(Screen[None]):
             elif export_type == "queue-export-radio":
                 queue = self._load_queue_for_export(course_id)
 
-                entries = list(queue.entries)
-                if filters:
-                    if filters.get("task"):
-                        entries = [e for e in entries if e.task_title == filters["task"]]
-                    if filters.get("status"):
-                        entries = [e for e in entries if e.status_name == filters["status"]]
-                    if filters.get("reviewer"):
-                        entries = [e for e in entries if e.responsible_name == filters["reviewer"]]
+                entries = _filter_queue_entries(queue.entries, filters)
 
                 filtered_queue = ReviewQueue(
                     course_id=queue.course_id,
@@ -2090,15 +2411,7 @@ class MainScreen(Screen[None]):
 
             elif export_type == "subs-export-radio":
                 queue = self._load_queue_for_export(course_id)
-                entries = list(queue.entries)
-
-                if filters:
-                    if filters.get("task"):
-                        entries = [e for e in entries if e.task_title == filters["task"]]
-                    if filters.get("status"):
-                        entries = [e for e in entries if e.status_name == filters["status"]]
-                    if filters.get("reviewer"):
-                        entries = [e for e in entries if e.responsible_name == filters["reviewer"]]
+                entries = _filter_queue_entries(queue.entries, filters)
 
                 accessible_entries = [e for e in entries if e.has_issue_access and e.issue_url]
                 if not accessible_entries:
@@ -2120,22 +2433,25 @@ class MainScreen(Screen[None]):
 
                 subs: list[Submission] = []
                 total = len(accessible_entries)
-                for i, entry in enumerate(accessible_entries, 1):
-                    self.app.call_from_thread(
-                        self._set_export_status,
-                        f"Fetching submissions: {i}/{total}...",
-                        "info",
-                    )
-                    try:
-                        sub_html = client.fetch_submission_page(entry.issue_url)
-                        issue_id = extract_issue_id_from_breadcrumb(sub_html)
-                        if issue_id == 0:
-                            continue
-                        sub = parse_submission_page(sub_html, issue_id)
-                        subs.append(sub)
-                    except Exception:
-                        logger.debug("Failed to fetch submission", exc_info=True)
-                        continue  # Skip failed fetches
+                client.ensure_authenticated()
+                with ThreadPoolExecutor(max_workers=_EXPORT_FETCH_WORKERS) as pool:
+                    futures = [
+                        pool.submit(self._cached_or_fetch_submission, client, e.issue_url)
+                        for e in accessible_entries
+                    ]
+                    for i, future in enumerate(futures, 1):
+                        self.app.call_from_thread(
+                            self._set_export_status,
+                            f"Fetching submissions: {i}/{total}...",
+                            "info",
+                        )
+                        try:
+                            sub = future.result()
+                        except Exception:
+                            logger.debug("Failed to fetch submission", exc_info=True)
+                            continue  # Skip failed fetches
+                        if sub is not None:
+                            subs.append(sub)
 
                 if not subs:
                     self.app.call_from_thread(
@@ -2165,16 +2481,12 @@ class MainScreen(Screen[None]):
                 elif fmt == "csv":
                     saved = save_submissions_csv(subs, course_id, output_path)
                 elif fmt == "json":
-                    import json as json_mod
-                    from dataclasses import asdict
-
                     saved = output_path / f"submissions_{course_id}.json"
-                    saved.write_text(
-                        json_mod.dumps(
-                            [asdict(s) for s in subs],
-                            indent=2,
+                    saved.write_bytes(
+                        orjson.dumps(
+                            subs,
                             default=str,
-                            ensure_ascii=False,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
                         )
                     )
                 else:
@@ -2233,10 +2545,8 @@ class MainScreen(Screen[None]):
         cache = self.app.queue_cache  # type: ignore[attr-defined]
         cached = cast(ReviewQueue | None, cache.get(course_id))
         if cached is not None:
-            self.all_queue_entries = list(cached.entries)
-            self.filtered_queue_entries = list(cached.entries)
-            self._queue_loaded_for = course_id
-            self.app.call_from_thread(self._update_queue_info, f"{len(cached.entries)} entries")
+            if self._queue_loaded_for != course_id:
+                self.app.call_from_thread(self._apply_loaded_queue, cached)
             return cached
 
         client = self.app.client  # type: ignore[attr-defined]
@@ -2246,30 +2556,10 @@ class MainScreen(Screen[None]):
         queue_html = client.fetch_queue_page(course_id)
         csrf = extract_csrf_from_queue_page(queue_html)
         raw = client.fetch_all_queue_entries(course_id, csrf)
-        entries = [
-            QueueEntry(
-                student_name=str(r.get("student_name", "")),
-                student_url=str(r.get("student_url", "")),
-                task_title=str(r.get("task_title", "")),
-                update_time=str(r.get("update_time", "")),
-                mark=str(r.get("mark", "")),
-                status_color=str(r.get("status_color", "default")),
-                status_name=str(r.get("status_name", "")),
-                responsible_name=str(r.get("responsible_name", "")),
-                responsible_url=str(r.get("responsible_url", "")),
-                has_issue_access=bool(r.get("has_issue_access", False)),
-                issue_url=str(r.get("issue_url", "")),
-            )
-            for r in raw
-        ]
+        entries = [_queue_entry_from_row(r) for r in raw]
         queue = ReviewQueue(course_id=course_id, entries=entries)
         cache[course_id] = queue
-        self.all_queue_entries = entries
-        self.filtered_queue_entries = list(entries)
-        self._queue_loaded_for = course_id
-        self.app.call_from_thread(self._update_queue_filter_options)
-        self.app.call_from_thread(self._rebuild_queue_table)
-        self.app.call_from_thread(self._update_queue_info, f"{len(entries)} entries")
+        self.app.call_from_thread(self._apply_loaded_queue, queue)
         return queue
 
     def _load_gradebook_for_export(self, course_id: int) -> Gradebook:
@@ -2277,14 +2567,8 @@ class MainScreen(Screen[None]):
         cache = self.app.gradebook_cache  # type: ignore[attr-defined]
         cached = cast(Gradebook | None, cache.get(course_id))
         if cached is not None:
-            self.all_gradebook_groups = list(cached.groups)
-            self.filtered_gradebook_groups = list(cached.groups)
-            self._gradebook_loaded_for = course_id
-            total = sum(len(g.entries) for g in cached.groups)
-            self.app.call_from_thread(
-                self._update_gradebook_info,
-                f"{len(cached.groups)} group(s), {total} students",
-            )
+            if self._gradebook_loaded_for != course_id:
+                self.app.call_from_thread(self._apply_loaded_gradebook, cached)
             return cached
 
         client = self.app.client  # type: ignore[attr-defined]
@@ -2294,16 +2578,7 @@ class MainScreen(Screen[None]):
         html = client.fetch_gradebook_page(course_id)
         gradebook = parse_gradebook_page(html, course_id)
         cache[course_id] = gradebook
-        self.all_gradebook_groups = list(gradebook.groups)
-        self.filtered_gradebook_groups = list(gradebook.groups)
-        self._gradebook_loaded_for = course_id
-        self.app.call_from_thread(self._update_gb_filter_options)
-        self.app.call_from_thread(self._rebuild_gradebook_table, gradebook.groups)
-        total = sum(len(g.entries) for g in gradebook.groups)
-        self.app.call_from_thread(
-            self._update_gradebook_info,
-            f"{len(gradebook.groups)} group(s), {total} students",
-        )
+        self.app.call_from_thread(self._apply_loaded_gradebook, gradebook)
         return gradebook
 
     @work(thread=True)
@@ -2352,7 +2627,7 @@ class MainScreen(Screen[None]):
             )
 
     def _add_course_option(self, course: Course) -> None:
-        option_list = self.query_one("#course-list", OptionList)
+        option_list = self._course_list
         title = course.title or f"Course {course.course_id}"
         option_list.add_option(Option(title, id=str(course.course_id)))
 
@@ -2361,28 +2636,36 @@ class MainScreen(Screen[None]):
         if self._selected_course_id is None:
             return
         if not self.is_teacher_view:
-            self.query_one("#queue-info-label", Label).update(
-                "Queue available for teacher courses only"
-            )
+            self._queue_info_label.update("Queue available for teacher courses only")
             return
         if self._queue_loaded_for == self._selected_course_id:
             return
 
         cache = self.app.queue_cache  # type: ignore[attr-defined]
         if self._selected_course_id in cache:
-            queue = cache[self._selected_course_id]
-            self.all_queue_entries = list(queue.entries)
-            self.filtered_queue_entries = list(queue.entries)
-            self._queue_loaded_for = self._selected_course_id
-            self._update_queue_filter_options()
-            self._rebuild_queue_table()
-            self.query_one("#queue-info-label", Label).update(f"{len(queue.entries)} entries")
+            self._apply_loaded_queue(cache[self._selected_course_id])
             return
 
-        self.query_one("#queue-info-label", Label).update("Loading queue...")
+        self._queue_info_label.update("Loading queue...")
         self._fetch_queue(self._selected_course_id)
 
-    @work(thread=True)
+    def _apply_loaded_queue(
+        self, queue: ReviewQueue, options: tuple[list[str], ...] | None = None
+    ) -> None:
+        """Show a loaded queue unless the user has moved to another course."""
+        if queue.course_id != self._selected_course_id:
+            return
+        self.all_queue_entries = list(queue.entries)
+        if options is not None:
+            self._queue_options = options
+            self._queue_options_source = self.all_queue_entries
+        self.filtered_queue_entries = list(queue.entries)
+        self._queue_loaded_for = queue.course_id
+        self._update_queue_filter_options()
+        self._rebuild_queue_table()
+        self._queue_info_label.update(f"{len(queue.entries)} entries")
+
+    @work(thread=True, exclusive=True, group="queue-loader")
     def _fetch_queue(self, course_id: int) -> None:
         try:
             client = self.app.client  # type: ignore[attr-defined]
@@ -2394,33 +2677,14 @@ class MainScreen(Screen[None]):
             csrf = extract_csrf_from_queue_page(queue_html)
 
             raw = client.fetch_all_queue_entries(course_id, csrf)
-            entries = [
-                QueueEntry(
-                    student_name=str(r.get("student_name", "")),
-                    student_url=str(r.get("student_url", "")),
-                    task_title=str(r.get("task_title", "")),
-                    update_time=str(r.get("update_time", "")),
-                    mark=str(r.get("mark", "")),
-                    status_color=str(r.get("status_color", "default")),
-                    status_name=str(r.get("status_name", "")),
-                    responsible_name=str(r.get("responsible_name", "")),
-                    responsible_url=str(r.get("responsible_url", "")),
-                    has_issue_access=bool(r.get("has_issue_access", False)),
-                    issue_url=str(r.get("issue_url", "")),
-                )
-                for r in raw
-            ]
+            entries = [_queue_entry_from_row(r) for r in raw]
 
             queue = ReviewQueue(course_id=course_id, entries=entries)
             self.app.queue_cache[course_id] = queue  # type: ignore[attr-defined]
 
-            self.all_queue_entries = entries
-            self.filtered_queue_entries = list(entries)
-            self._queue_loaded_for = course_id
-
-            self.app.call_from_thread(self._update_queue_filter_options)
-            self.app.call_from_thread(self._rebuild_queue_table)
-            self.app.call_from_thread(self._update_queue_info, f"{len(entries)} entries")
+            options = _queue_option_lists(entries)
+            if not get_current_worker().is_cancelled:
+                self.app.call_from_thread(self._apply_loaded_queue, queue, options)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
                 self.app.call_from_thread(self._disable_queue_tab)
@@ -2443,36 +2707,31 @@ class MainScreen(Screen[None]):
             self.app.call_from_thread(self._update_queue_info, f"Error: {e}")
 
     def _update_queue_info(self, text: str) -> None:
-        self.query_one("#queue-info-label", Label).update(text)
+        self._queue_info_label.update(text)
 
     def _disable_queue_tab(self) -> None:
-        self.query_one("#queue-filter-bar", QueueFilterBar).disabled = True
-        self.query_one("#queue-table", DataTable).disabled = True
-        self.query_one("#queue-info-label", Label).update("No permission to view queue")
+        self._queue_filter_bar.disabled = True
+        self._queue_table.disabled = True
+        self._queue_info_label.update("No permission to view queue")
 
     def _enable_queue_tab(self) -> None:
-        self.query_one("#queue-filter-bar", QueueFilterBar).disabled = False
-        self.query_one("#queue-table", DataTable).disabled = False
+        self._queue_filter_bar.disabled = False
+        self._queue_table.disabled = False
 
     @work(thread=True)
     def _fetch_and_show_submission(self, entry: QueueEntry) -> None:
         try:
-            if self._selected_course_id is not None:
-                cache = self.app.queue_cache.get(  # type: ignore[attr-defined]
-                    self._selected_course_id
-                )
-                if cache and entry.issue_url in cache.submissions:
-                    sub = cache.submissions[entry.issue_url]
-                    self.app.call_from_thread(self._push_submission_screen, sub)
-                    return
+            cached = self._cached_submission(entry.issue_url)
+            if cached is not None:
+                self.app.call_from_thread(self._push_submission_screen, cached)
+                return
 
             client = self.app.client  # type: ignore[attr-defined]
             if not client:
                 return
 
-            html = client.fetch_submission_page(entry.issue_url)
-            issue_id = extract_issue_id_from_breadcrumb(html)
-            if issue_id == 0:
+            sub = self._fetch_submission(client, entry.issue_url)
+            if sub is None:
                 self.app.call_from_thread(
                     self._show_status,
                     "Could not find issue ID",
@@ -2480,15 +2739,6 @@ class MainScreen(Screen[None]):
                 )
                 return
 
-            sub = parse_submission_page(html, issue_id)
-
-            if self._selected_course_id is not None:
-                cache = self.app.queue_cache.get(  # type: ignore[attr-defined]
-                    self._selected_course_id
-                )
-                if cache:
-                    cache.submissions[entry.issue_url] = sub
-
             self.app.call_from_thread(self._push_submission_screen, sub)
         except Exception as e:
             self.app.call_from_thread(
@@ -2497,6 +2747,58 @@ class MainScreen(Screen[None]):
                 kind="error",
             )
 
+    def _cached_submission(self, issue_url: str) -> Submission | None:
+        """Return a cached submission for the current course, marking it recently used."""
+        if self._selected_course_id is None:
+            return None
+        cache = self.app.queue_cache.get(  # type: ignore[attr-defined]
+            self._selected_course_id
+        )
+        if not cache:
+            return None
+        subs = cache.submissions
+        with self._submission_lock:
+            sub: Submission | None = subs.pop(issue_url, None)
+            if sub is not None:
+                subs[issue_url] = sub
+        return sub
+
+    def _cached_or_fetch_submission(self, client: Any, issue_url: str) -> Submission | None:
+        """Return the cached submission, or fetch it alongside any in-flight request."""
+        cached = self._cached_submission(issue_url)
+        return cached if cached is not None else self._fetch_submission(client, issue_url)
+
+    def _fetch_submission(self, client: Any, issue_url: str) -> Submission | None:
+        """Fetch, parse and cache a submission, sharing one request per URL across workers."""
+        with self._submission_lock:
+            future = self._inflight.get(issue_url)
+            owner = future is None
+            if future is None:
+                future = self._inflight[issue_url] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            sub = _load_submission(client, issue_url)
+            if sub is not None and self._selected_course_id is not None:
+                cache = self.app.queue_cache.get(  # type: ignore[attr-defined]
+                    self._selected_course_id
+                )
+                if cache:
+                    subs = cache.submissions
+                    with self._submission_lock:
+                        subs[issue_url] = sub
+                        while len(subs) > _SUBMISSION_CACHE_SIZE:
+                            del subs[next(iter(subs))]
+            future.set_result(sub)
+            return sub
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._submission_lock:
+                self._inflight.pop(issue_url, None)
+
     def _push_submission_screen(self, sub: Submission) -> None:
         from anytask_scraper.tui.screens.submission import (
             SubmissionScreen,
@@ -2505,7 +2807,7 @@ class MainScreen(Screen[None]):
         self.app.push_screen(SubmissionScreen(sub))
 
     def _setup_task_table_columns(self) -> None:
-        table = self.query_one("#task-table", DataTable)
+        table = self._task_table
         table.clear(columns=True)
         if self.is_teacher_view:
             table.add_columns("#", "Title", "Section", "Max", "Deadline")
@@ -2513,33 +2815,46 @@ class MainScreen(Screen[None]):
             table.add_columns("#", "Title", "Score", "Status", "Deadline")
 
     def _rebuild_task_table(self) -> None:
-        table = self.query_one("#task-table", DataTable)
+        with self.app.batch_update():
+            self._fill_task_table()
+
+    def _fill_task_table(self) -> None:
+        table = self._task_table
         if not table.columns:
             self._setup_task_table_columns()
         table.clear()
-
-        for idx, task in enumerate(self.filtered_tasks, 1):
-            if self.is_teacher_view:
-                table.add_row(
-                    str(idx),
-                    Text(task.title),
-                    Text(task.section or "-", style="dim"),
-                    str(task.max_score) if task.max_score is not None else "-",
-                    _styled_deadline(task.deadline),
-                    key=str(idx),
-                )
-            else:
-                table.add_row(
-                    str(idx),
-                    Text(task.title),
-                    _format_score(task),
-                    _styled_status(task.status),
-                    _styled_deadline(task.deadline),
-                    key=str(idx),
-                )
+        task_by_key = self._task_by_key
+        task_by_key.clear()
+        now = self._deadline_now = datetime.now()
+        soon = self._deadline_soon = now + _DEADLINE_SOON
+        tasks = self.filtered_tasks
+        numbers = _row_numbers(len(tasks))
+        add_row = table.add_row
+        cells = self._task_row_cells()
+        teacher_view = self.is_teacher_view
+
+        for idx, task in enumerate(tasks, 1):
+            num = numbers[idx]
+            fixed = cells.get(id(task))
+            if fixed is None:
+                if teacher_view:
+                    fixed = (
+                        Text(task.title),
+                        Text(task.section or "-", style="dim"),
+                        str(task.max_score) if task.max_score is not None else "-",
+                    )
+                else:
+                    fixed = (Text(task.title), _format_score(task), _styled_status(task.status))
+                cells[id(task)] = fixed
+            row_key = add_row(num, *fixed, _styled_deadline(task.deadline, now, soon), key=num)
+            task_by_key[row_key] = task
 
     def _rebuild_queue_table(self) -> None:
-        table = self.query_one("#queue-table", DataTable)
+        with self.app.batch_update():
+            self._fill_queue_table()
+
+    def _fill_queue_table(self) -> None:
+        table = self._queue_table
         table.clear(columns=True)
 
         base_columns = (
@@ -2560,63 +2875,63 @@ class MainScreen(Screen[None]):
                 labels.append(col)
         table.add_columns(*labels)
 
+        add_row = table.add_row
+        numbers = _row_numbers(len(self.filtered_queue_entries))
         for idx, entry in enumerate(self.filtered_queue_entries, 1):
-            style = _QUEUE_STATUS_COLORS.get(entry.status_color, "")
-            table.add_row(
-                str(idx),
+            num = numbers[idx]
+            add_row(
+                num,
                 entry.student_name,
                 entry.task_title,
-                Text(entry.status_name, style=style),
+                _styled_queue_status(entry.status_name, entry.status_color),
                 entry.responsible_name,
                 entry.update_time,
                 entry.mark,
-                key=entry.issue_url or str(idx),
+                key=entry.issue_url or num,
             )
 
     def _clear_detail(self) -> None:
-        scroll = self.query_one("#detail-scroll", VerticalScroll)
+        scroll = self._detail_scroll
         scroll.remove_children()
         scroll.mount(Label("[dim]Select a task[/dim]"))
 
     def _show_detail(self, task: Task) -> None:
-        scroll = self.query_one("#detail-scroll", VerticalScroll)
-        scroll.remove_children()
-
-        scroll.mount(Label(f"[bold]{task.title}[/bold]", classes="detail-heading"))
+        lines = [f"[bold]{escape(task.title)}[/bold]"]
 
         if not self.is_teacher_view:
             score = _format_score(task)
             status_style = _STATUS_STYLES.get(task.status, "")
-            status_txt = task.status or "-"
-            scroll.mount(
-                Label(
-                    f"Score: {score}  Status: [{status_style}]{status_txt}[/{status_style}]",
-                    classes="detail-text",
-                )
-            )
+            status_txt = escape(task.status or "-")
+            if status_style:
+                status_txt = f"[{status_style}]{status_txt}[/{status_style}]"
+            lines.append(f"Score: {score}  Status: {status_txt}")
         else:
             parts: list[str] = []
             if task.max_score is not None:
                 parts.append(f"Max: {task.max_score}")
             if task.section:
-                parts.append(f"Group: {task.section}")
+                parts.append(f"Group: {escape(task.section)}")
             if parts:
-                scroll.mount(Label("  ".join(parts), classes="detail-text"))
+                lines.append("  ".join(parts))
 
         if task.deadline:
-            now = datetime.now()
-            dl = task.deadline.strftime("%H:%M %d.%m.%Y")
+            now = self._deadline_now
+            d = task.deadline
+            dl = f"{d.hour:02d}:{d.minute:02d} {d.day:02d}.{d.month:02d}.{d.year}"
             if task.deadline < now:
                 dl_text = f"[dim strike]{dl}[/dim strike] (passed)"
-            elif task.deadline < now + timedelta(days=3):
+            elif task.deadline < self._deadline_soon:
                 dl_text = f"[bold yellow]{dl}[/bold yellow] (soon)"
             else:
                 dl_text = dl
-            scroll.mount(Label(f"Deadline: {dl_text}", classes="detail-text"))
+            lines.append(f"Deadline: {dl_text}")
 
         if task.description:
-            desc = strip_html(task.description)
-            scroll.mount(Label(desc, classes="detail-text"))
+            lines.append(escape(strip_html(task.description)))
+
+        scroll = self._detail_scroll
+        scroll.remove_children()
+        scroll.mount(Static("\n".join(lines), classes="detail-text"))
 
     _GRADEBOOK_COLOR_MAP: dict[str, str] = {
         "#65E31B": "bold green",
@@ -2634,22 +2949,25 @@ class MainScreen(Screen[None]):
 
         cache = self.app.gradebook_cache  # type: ignore[attr-defined]
         if self._selected_course_id in cache:
-            gradebook = cache[self._selected_course_id]
-            self._gradebook_loaded_for = self._selected_course_id
-            self.all_gradebook_groups = list(gradebook.groups)
-            self.filtered_gradebook_groups = list(gradebook.groups)
-            self._update_gb_filter_options()
-            self._rebuild_gradebook_table(gradebook.groups)
-            total = sum(len(g.entries) for g in gradebook.groups)
-            self.query_one("#gradebook-info-label", Label).update(
-                f"{len(gradebook.groups)} group(s), {total} students"
-            )
+            self._apply_loaded_gradebook(cache[self._selected_course_id])
             return
 
-        self.query_one("#gradebook-info-label", Label).update("Loading gradebook...")
+        self._gradebook_info_label.update("Loading gradebook...")
         self._fetch_gradebook(self._selected_course_id)
 
-    @work(thread=True)
+    def _apply_loaded_gradebook(self, gradebook: Gradebook) -> None:
+        """Show a loaded gradebook unless the user has moved to another course."""
+        if gradebook.course_id != self._selected_course_id:
+            return
+        self._gradebook_loaded_for = gradebook.course_id
+        self.all_gradebook_groups = list(gradebook.groups)
+        self.filtered_gradebook_groups = list(gradebook.groups)
+        self._update_gb_filter_options()
+        self._rebuild_gradebook_table(gradebook.groups)
+        total = sum(len(g.entries) for g in gradebook.groups)
+        self._gradebook_info_label.update(f"{len(gradebook.groups)} group(s), {total} students")
+
+    @work(thread=True, exclusive=True, group="gradebook-loader")
     def _fetch_gradebook(self, course_id: int) -> None:
         try:
             client = self.app.client  # type: ignore[attr-defined]
@@ -2661,17 +2979,9 @@ class MainScreen(Screen[None]):
             gradebook = parse_gradebook_page(html, course_id)
 
             self.app.gradebook_cache[course_id] = gradebook  # type: ignore[attr-defined]
-            self._gradebook_loaded_for = course_id
-            self.all_gradebook_groups = list(gradebook.groups)
-            self.filtered_gradebook_groups = list(gradebook.groups)
 
-            self.app.call_from_thread(self._update_gb_filter_options)
-            self.app.call_from_thread(self._rebuild_gradebook_table, gradebook.groups)
-            total = sum(len(g.entries) for g in gradebook.groups)
-            self.app.call_from_thread(
-                self._update_gradebook_info,
-                f"{len(gradebook.groups)} group(s), {total} students",
-            )
+            if not get_current_worker().is_cancelled:
+                self.app.call_from_thread(self._apply_loaded_gradebook, gradebook)
         except httpx.HTTPStatusError as e:
             self.app.call_from_thread(
                 self._show_status,
@@ -2692,15 +3002,33 @@ class MainScreen(Screen[None]):
 
     @on(GradebookFilterBar.Changed)
     def _handle_gb_filter(self, event: GradebookFilterBar.Changed) -> None:
+        """Apply select changes at once; debounce bursts of text edits."""
+        last = self._gb_filter
+        self._gb_filter = event
+        if self._gb_filter_timer is not None:
+            self._gb_filter_timer.stop()
+            self._gb_filter_timer = None
+        if last is not None and (last.group, last.teacher) == (event.group, event.teacher):
+            self._gb_filter_timer = self.set_timer(_FILTER_DEBOUNCE, self._apply_gb_filter)
+        else:
+            self._apply_gb_filter()
+
+    def _apply_gb_filter(self) -> None:
+        self._gb_filter_timer = None
+        event = self._gb_filter
+        if event is None:
+            return
         needle = event.text.lower()
+        students_lc = self._gb_students_lc() if needle else []
         filtered: list[GradebookGroup] = []
-        for g in self.all_gradebook_groups:
+        for gi, g in enumerate(self.all_gradebook_groups):
             if event.group and event.group != g.group_name:
                 continue
             if event.teacher and event.teacher != g.teacher_name:
                 continue
             if needle:
-                entries = [e for e in g.entries if needle in e.student_name.lower()]
+                names_lc = students_lc[gi]
+                entries = [e for ei, e in enumerate(g.entries) if needle in names_lc[ei]]
             else:
                 entries = list(g.entries)
             if entries or (not needle):
@@ -2720,17 +3048,19 @@ class MainScreen(Screen[None]):
         else:
             self._rebuild_gradebook_table(filtered)
         total = sum(len(g.entries) for g in filtered)
-        self.query_one("#gradebook-info-label", Label).update(
-            f"{len(filtered)} group(s), {total} students"
-        )
+        self._gradebook_info_label.update(f"{len(filtered)} group(s), {total} students")
 
     def _update_gb_filter_options(self) -> None:
-        groups = sorted({g.group_name for g in self.all_gradebook_groups if g.group_name})
-        teachers = sorted({g.teacher_name for g in self.all_gradebook_groups if g.teacher_name})
-        self.query_one("#gb-filter-bar", GradebookFilterBar).update_options(groups, teachers)
+        self._export_filters_dirty = True
+        groups, teachers = self._gb_filter_options()
+        self._gb_filter_bar.update_options(groups, teachers)
 
     def _rebuild_gradebook_table(self, groups: list[GradebookGroup]) -> None:
-        table = self.query_one("#gradebook-table", DataTable)
+        with self.app.batch_update():
+            self._fill_gradebook_table(groups)
+
+    def _fill_gradebook_table(self, groups: list[GradebookGroup]) -> None:
+        table = self._gradebook_table
         table.clear(columns=True)
 
         if not groups:
@@ -2738,13 +3068,17 @@ class MainScreen(Screen[None]):
             table.add_row("No gradebook data")
             return
 
-        all_tasks: list[str] = []
-        for g in groups:
-            for t in g.task_titles:
-                if t not in all_tasks:
-                    all_tasks.append(t)
+        all_tasks = _gradebook_task_titles(groups)
         self._gb_all_tasks = all_tasks
+        self._fill_gradebook_rows(
+            [(group, entry) for group in groups for entry in group.entries], all_tasks
+        )
 
+    def _fill_gradebook_rows(
+        self, rows: list[tuple[GradebookGroup, GradebookEntry]], all_tasks: list[str]
+    ) -> None:
+        """Add gradebook columns and one row per (group, entry) pair to the cleared table."""
+        table = self._gradebook_table
         base_columns = ["#", "Group", "Student", "Teacher"] + all_tasks + ["Total"]
         labels = []
         for i, col in enumerate(base_columns):
@@ -2755,24 +3089,24 @@ class MainScreen(Screen[None]):
                 labels.append(f"{col}  ")  # Placeholder for " arrow"
         table.add_columns(*labels)
 
-        row_num = 0
-        for group in groups:
-            for entry in group.entries:
-                row_num += 1
-                row: list[str | Text] = [
-                    str(row_num),
-                    group.group_name,
-                    entry.student_name,
-                    group.teacher_name,
-                ]
-                for t in all_tasks:
-                    score = entry.scores.get(t)
-                    color_hex = entry.statuses.get(t, "")
-                    style = self._GRADEBOOK_COLOR_MAP.get(color_hex, "")
-                    score_str = str(score) if score is not None else "-"
-                    row.append(Text(score_str, style=style))
-                row.append(str(entry.total_score))
-                table.add_row(*row, key=str(row_num))
+        color_map = self._GRADEBOOK_COLOR_MAP
+        numbers = _row_numbers(len(rows))
+        add_row = table.add_row
+        for row_num, (group, entry) in enumerate(rows, 1):
+            scores = entry.scores
+            statuses = entry.statuses
+            row: list[str | Text] = [
+                numbers[row_num],
+                group.group_name,
+                entry.student_name,
+                group.teacher_name,
+            ]
+            for t in all_tasks:
+                score = scores.get(t)
+                style = color_map.get(statuses.get(t, ""), "")
+                row.append(Text(str(score) if score is not None else "-", style=style))
+            row.append(str(entry.total_score))
+            add_row(*row, key=numbers[row_num])
 
     @on(DataTable.HeaderSelected, "#gradebook-table")
     def _gb_header_selected(self, event: DataTable.HeaderSelected) -> None:
@@ -2796,11 +3130,7 @@ class MainScreen(Screen[None]):
             for e in g.entries:
                 flat.append((g, e))
 
-        all_tasks: list[str] = []
-        for g in self.filtered_gradebook_groups:
-            for t in g.task_titles:
-                if t not in all_tasks:
-                    all_tasks.append(t)
+        all_tasks = _gradebook_task_titles(self.filtered_gradebook_groups)
         self._gb_all_tasks = all_tasks
 
         num_fixed = 4  # #, Group, Student, Teacher
@@ -2825,34 +3155,9 @@ class MainScreen(Screen[None]):
                 reverse=self._gb_sort_reverse,
             )
 
-        table = self.query_one("#gradebook-table", DataTable)
-        table.clear(columns=True)
-
-        base_columns = ["#", "Group", "Student", "Teacher"] + all_tasks + ["Total"]
-        labels = []
-        for i, col_name in enumerate(base_columns):
-            if self._gb_sort_column == i:
-                indicator = " ▼" if self._gb_sort_reverse else " ▲"
-                labels.append(f"{col_name}{indicator}")
-            else:
-                labels.append(f"{col_name}  ")
-        table.add_columns(*labels)
-
-        for row_num, (group, entry) in enumerate(flat, 1):
-            row: list[str | Text] = [
-                str(row_num),
-                group.group_name,
-                entry.student_name,
-                group.teacher_name,
-            ]
-            for t in all_tasks:
-                score = entry.scores.get(t)
-                color_hex = entry.statuses.get(t, "")
-                style = self._GRADEBOOK_COLOR_MAP.get(color_hex, "")
-                score_str = str(score) if score is not None else "-"
-                row.append(Text(score_str, style=style))
-            row.append(str(entry.total_score))
-            table.add_row(*row, key=str(row_num))
+        with self.app.batch_update():
+            self._gradebook_table.clear(columns=True)
+            self._fill_gradebook_rows(flat, all_tasks)
 
     def _update_gradebook_info(self, text: str) -> None:
-        self.query_one("#gradebook-info-label", Label).update(text)
+        self._gradebook_info_label.update(text)
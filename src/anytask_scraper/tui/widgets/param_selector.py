@@ -15,6 +15,14 @@ from textual.widgets.option_list import Option
 from anytask_scraper.tui.export_params import ExportParam
 
 
+def _param_label(param: ExportParam) -> Text:
+    check = "[x]" if param.selected else "[ ]"
+    label = Text()
+    label.append(f"{check}  {param.name}\n")
+    label.append(f"     {param.description}", style="dim")
+    return label
+
+
 class ParameterSelector(Vertical):
     """A toggleable parameter list with names and descriptions."""
 
@@ -42,12 +50,9 @@ class ParameterSelector(Vertical):
     def _rebuild(self) -> None:
         option_list = self.query_one("#param-option-list", OptionList)
         option_list.clear_options()
-        for i, p in enumerate(self._params):
-            check = "[x]" if p.selected else "[ ]"
-            label = Text()
-            label.append(f"{check}  {p.name}\n")
-            label.append(f"     {p.description}", style="dim")
-            option_list.add_option(Option(label, id=str(i)))
+        option_list.add_options(
+            [Option(_param_label(p), id=str(i)) for i, p in enumerate(self._params)]
+        )
 
     def get_included(self) -> list[str]:
         """Return names of selected parameters."""
@@ -59,8 +64,7 @@ class ParameterSelector(Vertical):
             return
         idx = int(event.option_id)
         if 0 <= idx < len(self._params):
-            self._params[idx].selected = not self._params[idx].selected
-            self._rebuild()
-            option_list = self.query_one("#param-option-list", OptionList)
-            option_list.highlighted = idx
+            param = self._params[idx]
+            param.selected = not param.selected
+            event.option_list.replace_option_prompt_at_index(idx, _param_label(param))
             self.post_message(self.Changed(self.get_included()))